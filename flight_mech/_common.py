@@ -11,12 +11,40 @@ Module to define common functions for all flight-mech modules.
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Optional dependencies #
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Replacement for numba.njit when numba is not installed. The decorated function is returned unchanged.
+        """
+
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
 #############
 # Constants #
 #############
 
 LAZY_MEMORY_LIMIT = 10
 
+# Phases ids of the landing, shared by flight_mech.maneuver and its compiled kernel
+LANDING_INITIAL_TOUCHDOWN = 0
+LANDING_ROTATION = 1
+LANDING_BRAKING = 2
+LANDING_STOPPED = 3
+
 #############
 # Functions #
 #############
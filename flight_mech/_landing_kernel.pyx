@@ -0,0 +1,213 @@
+# cython: language_level=3
+"""
+Compiled kernel to integrate the landing maneuver.
+
+This extension is optional. When it is not built, the landing maneuver falls back to its pure Python implementation.
+"""
+
+###########
+# Imports #
+###########
+
+cimport cython
+from libc.math cimport cos, sin, fabs
+
+from flight_mech._common import LANDING_INITIAL_TOUCHDOWN, LANDING_ROTATION, LANDING_BRAKING, LANDING_STOPPED
+
+#############
+# Constants #
+#############
+
+# Phases ids, converted once at import from the LANDING_* phase ids of flight_mech._common
+cdef int PHASE_INITIAL_TOUCHDOWN = LANDING_INITIAL_TOUCHDOWN
+cdef int PHASE_ROTATION = LANDING_ROTATION
+cdef int PHASE_BRAKING = LANDING_BRAKING
+cdef int PHASE_STOPPED = LANDING_STOPPED
+
+# Indices of the variables in the state buffer
+cdef enum:
+    STATE_INCIDENCE = 0
+    STATE_VELOCITY = 1
+    STATE_GROUND_DISTANCE = 2
+    STATE_BRAKING_ENERGY = 3
+    STATE_LIFT_COEFFICIENT = 4
+    STATE_DRAG_COEFFICIENT = 5
+    STATE_LIFT = 6
+    STATE_DRAG = 7
+    STATE_GROUND_REACTION_FORCE = 8
+    STATE_GROUND_FRICTION_FORCE = 9
+    STATE_ACCELERATION = 10
+    STATE_SIZE = 11
+
+#############
+# Functions #
+#############
+
+cdef bint landing_step(
+        double* state,
+        double thrust,
+        double P,
+        double m,
+        double mu_g,
+        double mu_b,
+        double S,
+        double rho,
+        double C_L_alpha,
+        double alpha_0,
+        double C_D_0,
+        double k,
+        double parachute_drag_area,
+        double rotation_step,
+        double dt,
+        double early_exit_tol) noexcept nogil:
+    """
+    Advance the landing state of one time step. The state buffer is updated in place.
+
+    Returns true when the plane is at rest at the end of the step.
+    """
+
+    cdef double previous_velocity = state[STATE_VELOCITY]
+    cdef double dynamic_pressure = .5 * rho * previous_velocity * previous_velocity
+    cdef double incidence
+    cdef double lift_coefficient
+    cdef double ground_reaction_force
+    cdef double ground_friction_force
+    cdef double acceleration
+    cdef double velocity
+    cdef bint is_stopped
+
+    # Compute angle of incidence
+    incidence = state[STATE_INCIDENCE] - rotation_step
+    if incidence < 0:
+        incidence = 0
+
+    # Compute aerodynamic coefficients and forces (including the parachute drag)
+    lift_coefficient = C_L_alpha * (incidence - alpha_0)
+    state[STATE_LIFT_COEFFICIENT] = lift_coefficient
+    state[STATE_DRAG_COEFFICIENT] = C_D_0 + k * lift_coefficient * \
+        lift_coefficient + parachute_drag_area / S
+    state[STATE_DRAG] = dynamic_pressure * S * state[STATE_DRAG_COEFFICIENT]
+    state[STATE_LIFT] = dynamic_pressure * S * lift_coefficient
+
+    # Compute ground forces
+    ground_reaction_force = P - state[STATE_LIFT] - thrust * sin(incidence)
+    ground_friction_force = ground_reaction_force * (mu_g + mu_b)
+
+    # Compute acceleration and integrate
+    acceleration = (thrust * cos(incidence) -
+                    state[STATE_DRAG] - ground_friction_force) / m
+    velocity = previous_velocity + acceleration * dt
+
+    # Stop as soon as the plane is at rest
+    is_stopped = velocity <= 0 or fabs(acceleration) + velocity < early_exit_tol
+    if is_stopped:
+        velocity = 0
+
+    state[STATE_INCIDENCE] = incidence
+    state[STATE_GROUND_REACTION_FORCE] = ground_reaction_force
+    state[STATE_GROUND_FRICTION_FORCE] = ground_friction_force
+    state[STATE_ACCELERATION] = acceleration
+    state[STATE_VELOCITY] = velocity
+    state[STATE_GROUND_DISTANCE] += velocity * dt
+    state[STATE_BRAKING_ENERGY] += ground_reaction_force * mu_b * velocity * dt
+
+    return is_stopped
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def compute_landing_evolution(
+        signed char[::1] phase_array,
+        double[::1] time_array,
+        double[::1] thrust_array,
+        double[::1] incidence_array,
+        double[::1] lift_coefficient_array,
+        double[::1] drag_coefficient_array,
+        double[::1] ground_distance_array,
+        double[::1] velocity_array,
+        double[::1] acceleration_array,
+        double[::1] ground_reaction_force_array,
+        double[::1] ground_friction_force_array,
+        double[::1] drag_array,
+        double[::1] lift_array,
+        double[::1] braking_energy_array,
+        double max_thrust,
+        double P,
+        double m,
+        double mu_g,
+        double mu_b,
+        double S,
+        double rho,
+        double C_L_alpha,
+        double alpha_0,
+        double C_D_0,
+        double k,
+        double parachute_drag_area,
+        double rotation_speed,
+        double dt,
+        double early_exit_tol):
+    """
+    Integrate the landing maneuver in the given preallocated arrays.
+
+    The first element of each array must contain the initial conditions. The time array must be filled
+    beforehand and the thrust array must contain the thrust evolution factor at each time step.
+
+    Returns
+    -------
+    tuple[int,float]
+        Number of time steps filled and braking start time (negative if the braking phase is not reached).
+    """
+
+    cdef Py_ssize_t nb_max_iterations = time_array.shape[0]
+    cdef Py_ssize_t i = 1
+    cdef Py_ssize_t j
+    cdef int current_phase
+    cdef double braking_start_time = -1.
+    cdef double thrust
+    cdef double rotation_step = rotation_speed * dt
+    cdef double state[STATE_SIZE]
+
+    # Load the initial conditions
+    for j in range(STATE_SIZE):
+        state[j] = 0.
+    state[STATE_INCIDENCE] = incidence_array[0]
+    state[STATE_VELOCITY] = velocity_array[0]
+    state[STATE_GROUND_DISTANCE] = ground_distance_array[0]
+    state[STATE_BRAKING_ENERGY] = braking_energy_array[0]
+
+    with nogil:
+        while phase_array[i - 1] != PHASE_STOPPED and i < nb_max_iterations:
+            # Determine the phase
+            if state[STATE_VELOCITY] <= 0:
+                current_phase = PHASE_STOPPED
+            elif state[STATE_INCIDENCE] <= 0:
+                current_phase = PHASE_BRAKING
+                if phase_array[i - 1] == PHASE_ROTATION:
+                    braking_start_time = time_array[i]
+            else:
+                current_phase = PHASE_ROTATION
+
+            # Compute thrust
+            thrust = max_thrust * thrust_array[i]
+
+            # Advance of one time step
+            if landing_step(state, thrust, P, m, mu_g, mu_b, S, rho, C_L_alpha, alpha_0,
+                            C_D_0, k, parachute_drag_area, rotation_step, dt, early_exit_tol):
+                current_phase = PHASE_STOPPED
+
+            # Store the variables
+            phase_array[i] = current_phase
+            thrust_array[i] = thrust
+            incidence_array[i] = state[STATE_INCIDENCE]
+            lift_coefficient_array[i] = state[STATE_LIFT_COEFFICIENT]
+            drag_coefficient_array[i] = state[STATE_DRAG_COEFFICIENT]
+            lift_array[i] = state[STATE_LIFT]
+            drag_array[i] = state[STATE_DRAG]
+            ground_reaction_force_array[i] = state[STATE_GROUND_REACTION_FORCE]
+            ground_friction_force_array[i] = state[STATE_GROUND_FRICTION_FORCE]
+            acceleration_array[i] = state[STATE_ACCELERATION]
+            velocity_array[i] = state[STATE_VELOCITY]
+            ground_distance_array[i] = state[STATE_GROUND_DISTANCE]
+            braking_energy_array[i] = state[STATE_BRAKING_ENERGY]
+            i += 1
+
+    return i, braking_start_time
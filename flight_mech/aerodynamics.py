@@ -52,7 +52,7 @@ def check_turbulent_transition(x: float | np.ndarray, velocity: float | np.ndarr
     # Check transition
     if (reynolds > turbulent_reynolds).any():
         raise ValueError(
-            f"The boundary layer becomes turbulent. The Reynolds number at the end of the plate is {'{:3e}'.format(reynolds)}.")
+            f"The boundary layer becomes turbulent. The Reynolds number at the end of the plate is {'{:3e}'.format(np.max(reynolds))}.")
 
 def compute_blasius_linear_drag(x_array: np.ndarray, velocity_array: np.ndarray, rho: float, nu: float, return_array: bool = False):
     """
@@ -61,9 +61,10 @@ def compute_blasius_linear_drag(x_array: np.ndarray, velocity_array: np.ndarray,
     Parameters
     ----------
     x_array : np.ndarray
-        Array of x coordinates along the airfoil.
+        Array of x coordinates along the airfoil. Several airfoils can be stacked along the first axes,
+        the coordinates being along the last one.
     velocity_array : np.ndarray
-        Array of external velocity along the airfoil.
+        Array of external velocity along the airfoil, with the same shape as the x array.
     rho : float
         Density of the fluid.
     nu : float
@@ -71,15 +72,15 @@ def compute_blasius_linear_drag(x_array: np.ndarray, velocity_array: np.ndarray,
 
     Returns
     -------
-    float
-        Linear drag.
+    float | np.ndarray
+        Linear drag, with one value per stacked airfoil.
     """
 
     # Compute the length of the airfoil
-    length = x_array[-1]
+    length = x_array[..., -1]
 
     # Assume the external velocity is uniform
-    velocity = np.mean(velocity_array)
+    velocity = np.mean(velocity_array, axis=-1)
 
     # Check turbulent transition
     check_turbulent_transition(length, velocity, nu)
@@ -9,6 +9,7 @@ Module to analyse airfoil aerodynamic properties.
 # Python imports #
 
 import os
+import functools
 from typing import Literal
 
 # Dependencies #
@@ -49,6 +50,34 @@ def download_web_file(url, output_file):
     with open(output_file, 'wb') as file:
         file.write(response.content)
 
+@functools.lru_cache(maxsize=None)
+def _read_selig_file(file_path: str, skiprows: int, modification_time: float):
+    """
+    Load a selig file in a temporary airfoil and return its name and arrays.
+
+    The result is cached by file path and modification time, so each file is parsed once per process.
+    The returned arrays are shared and must be copied before use.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the file to load.
+    skiprows : int
+        Number of rows to skip at the beginning of the file.
+    modification_time : float
+        Modification time of the file, used to invalidate the cache.
+
+    Returns
+    -------
+    tuple[str,float,np.ndarray,np.ndarray,np.ndarray]
+        Name and chord length of the airfoil, x, extrados z and intrados z arrays.
+    """
+
+    airfoil = Airfoil()
+    airfoil._parse_selig_file(file_path, skiprows)
+
+    return airfoil.name, airfoil.chord_length, airfoil.x_array, airfoil.extrados_z_array, airfoil.intrados_z_array
+
 def rotate_arrays(x_array: np.ndarray, z_array: np.ndarray, angle: float, rotation_center: float = 0.25, x_length: float | None = None):
     """
     Rotate the given x and z arrays.
@@ -153,13 +182,14 @@ class Airfoil:
     """
 
     name: str | None = None
-    extrados_z_array: np.ndarray | None = None
-    intrados_z_array: np.ndarray | None = None
+    _extrados_z_array: np.ndarray | None = None
+    _intrados_z_array: np.ndarray | None = None
     _x_array: np.ndarray
     _chord_length: float
     _a0: float | None = None
     _a1: float | None = None
     _a2: float | None = None
+    _alpha_zero_lift: float | None = None
 
     def __init__(self, airfoil: str | None = None):
         if airfoil in self.list_airfoils_in_database():
@@ -167,6 +197,30 @@ class Airfoil:
         elif airfoil is not None:
             self.load_selig_file(airfoil)
 
+    @property
+    def extrados_z_array(self) -> np.ndarray:
+        """
+        Array of the extrados z coordinates.
+        """
+        return self._extrados_z_array
+
+    @extrados_z_array.setter
+    def extrados_z_array(self, value: np.ndarray):
+        self._extrados_z_array = value
+        self._reset_fourrier_coefficients()
+
+    @property
+    def intrados_z_array(self) -> np.ndarray:
+        """
+        Array of the intrados z coordinates.
+        """
+        return self._intrados_z_array
+
+    @intrados_z_array.setter
+    def intrados_z_array(self, value: np.ndarray):
+        self._intrados_z_array = value
+        self._reset_fourrier_coefficients()
+
     @property
     def camber_z_array(self) -> np.ndarray:
         """
@@ -304,6 +358,16 @@ class Airfoil:
             (self.extrados_z_array, self.intrados_z_array[::-1], [self.extrados_z_array[0]]), axis=0)
         return z_selig_array
 
+    def _reset_fourrier_coefficients(self):
+        """
+        Reset the cached Fourrier's coefficients and angle of incidence at zero lift after a change of shape.
+        """
+
+        self._a0 = None
+        self._a1 = None
+        self._a2 = None
+        self._alpha_zero_lift = None
+
     def get_chord_incidence(self):
         angle_of_incidence = np.atan(
             (self.chord_z_array[-1] - self.chord_z_array[0]) / (self.chord_length))
@@ -372,6 +436,27 @@ class Airfoil:
             Number of rows to skip at the beginning of the file, by default 1
         """
 
+        # Get the parsed airfoil from the cache and copy its arrays
+        name, chord_length, x_array, extrados_z_array, intrados_z_array = _read_selig_file(
+            file_path, skiprows, os.path.getmtime(file_path))
+        self.name = name
+        self._chord_length = chord_length
+        self._x_array = x_array.copy()
+        self.extrados_z_array = extrados_z_array.copy()
+        self.intrados_z_array = intrados_z_array.copy()
+
+    def _parse_selig_file(self, file_path: str, skiprows: int):
+        """
+        Parse a selig txt file without using the cache.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the file to load.
+        skiprows : int
+            Number of rows to skip at the beginning of the file.
+        """
+
         # Extract airfoil name
         with open(file_path, "r") as file:
             first_line = file.readline()
@@ -486,15 +571,14 @@ class Airfoil:
             Indicate wether to update the x array, by default True
         """
 
-        # Create interpolation functions
-        extrados_function = make_interp_spline(
-            self.x_array, self.extrados_z_array)
-        intrados_function = make_interp_spline(
-            self.x_array, self.intrados_z_array)
+        # Create a single interpolation function for the extrados and the intrados
+        faces_function = make_interp_spline(
+            self.x_array, np.stack((self.extrados_z_array, self.intrados_z_array), axis=1))
 
         # Interpolate on new points
-        self.extrados_z_array = extrados_function(new_x_array)
-        self.intrados_z_array = intrados_function(new_x_array)
+        new_faces_array = faces_function(new_x_array)
+        self.extrados_z_array = new_faces_array[:, 0].copy()
+        self.intrados_z_array = new_faces_array[:, 1].copy()
 
         # Update x array if needed
         if update_x_array:
@@ -707,14 +791,37 @@ class Airfoil:
             Momentum coefficient.
         """
 
+        # Compute the momentum coefficient with the lift coefficient
+        _, C_m = self.compute_lift_and_momentum_coefficients(alpha)
+
+        return C_m
+
+    def compute_lift_and_momentum_coefficients(self, alpha: float):
+        """
+        Compute the lift coefficient and the momentum coefficient at the aerodynamic center
+        for a given angle of incidence, evaluating the lift coefficient only once.
+
+        Parameters
+        ----------
+        alpha : float
+            Angle of incidence in radians.
+
+        Returns
+        -------
+        tuple[float,float]
+            Lift coefficient and momentum coefficient at the aerodynamic center.
+        """
+
+        # Compute the lift coefficient
+        C_L = self.compute_lift_coefficient(alpha)
+
         # Compute the momentum coefficient at leading edge
         C_m0 = self.compute_momentum_coefficient_at_leading_edge(alpha)
 
         # Move it at the aero center
-        C_m = C_m0 + 0.25 * self.chord_length * \
-            self.compute_lift_coefficient(alpha)
+        C_m = C_m0 + 0.25 * self.chord_length * C_L
 
-        return C_m
+        return C_L, C_m
 
     def plot_CL_graph(self,
                       alpha_min: float = -1,
@@ -857,6 +964,38 @@ class Airfoil:
 
         return rotated_x_array, rotated_z_array
 
+    def get_normalized_cosine_selig_arrays(self, nb_points: int):
+        """
+        Returns the selig arrays of the airfoil with a unit chord, interpolated on a x array defined by a cosine
+        distribution. The airfoil itself is not modified.
+
+        Parameters
+        ----------
+        nb_points : int
+            Number of points in the cosine distribution, for each face.
+
+        Returns
+        -------
+        tuple[np.ndarray,np.ndarray]
+            Tuple containing the selig arrays.
+        """
+
+        # Create the cosine distribution on the chord of the airfoil
+        theta_chord_array = np.linspace(0, np.pi, nb_points)
+        x_array = (self.chord_length / 2) * (1 - np.cos(theta_chord_array))
+
+        # Interpolate the extrados and the intrados on it
+        extrados_z_array, intrados_z_array = make_interp_spline(
+            self.x_array, np.stack((self.extrados_z_array, self.intrados_z_array), axis=1))(x_array).T
+
+        # Normalize and concatenate in selig format
+        x_selig_array = np.concatenate(
+            (x_array, x_array[::-1], [x_array[0]]), axis=0) / self.chord_length
+        z_selig_array = np.concatenate(
+            (extrados_z_array, intrados_z_array[::-1], [extrados_z_array[0]]), axis=0) / self.chord_length
+
+        return x_selig_array, z_selig_array
+
     def compute_alpha_zero_lift(self):
         """
         Compute the angle of incidence for which the airfoil's lift is zero.
@@ -867,11 +1006,16 @@ class Airfoil:
             Angle of incidence at zero lift.
         """
 
+        # Return the cached angle if the shape has not changed
+        if self._alpha_zero_lift is not None:
+            return self._alpha_zero_lift
+
         # Compute coefficients if needed
         if self._a0 is None:
             self.compute_airfoil_fourrier_coefficients()
 
         # Compute the angle
         alpha = (self._a0 * 2 - self._a1) / 2
+        self._alpha_zero_lift = alpha
 
         return alpha
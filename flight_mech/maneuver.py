@@ -8,8 +8,10 @@ Module to define plane maneuvers.
 
 # Python imports #
 
+import os
 from typing import Literal, Callable
 from abc import ABC, abstractmethod
+from math import cos, sin
 
 # Dependencies #
 
@@ -20,7 +22,423 @@ import numpy as np
 from flight_mech.plane import (
     Plane
 )
-from flight_mech._common import plot_graph
+from flight_mech._common import plot_graph, njit, prange, NUMBA_AVAILABLE, \
+    LANDING_INITIAL_TOUCHDOWN, LANDING_ROTATION, LANDING_BRAKING, LANDING_STOPPED
+
+# Optional compiled kernels #
+
+try:
+    from flight_mech._landing_kernel import compute_landing_evolution
+except ImportError:
+    compute_landing_evolution = None
+
+#############
+# Constants #
+#############
+
+# Phases ids of the take off and names indexed by id
+TAKE_OFF_INITIAL_ACCELERATION = 0
+TAKE_OFF_ROTATION = 1
+TAKE_OFF_FLIGHT = 2
+TAKE_OFF_PHASE_NAMES = ("initial_acceleration", "rotation", "flight")
+
+# Names of the landing phases indexed by id (the ids are defined in flight_mech._common)
+LANDING_PHASE_NAMES = ("initial_touchdown", "rotation", "braking", "stopped")
+
+# Bounds of the estimated number of iterations of the landing, doubled until the plane stops
+LANDING_MIN_NB_ITERATIONS = 1000
+LANDING_MAX_NB_ITERATIONS = 1_000_000
+
+# Rows of the state array of the maneuvers, one contiguous row per evolution variable
+STATE_TIME = 0
+STATE_THRUST = 1
+STATE_INCIDENCE = 2
+STATE_PITCH = 3
+STATE_ALTITUDE = 4
+STATE_LIFT_COEFFICIENT = 5
+STATE_DRAG_COEFFICIENT = 6
+STATE_GROUND_DISTANCE = 7
+STATE_VELOCITY = 8
+STATE_ACCELERATION = 9
+STATE_PITCH_DERIVATIVE = 10
+STATE_GROUND_REACTION_FORCE = 11
+STATE_GROUND_FRICTION_FORCE = 12
+STATE_DRAG = 13
+STATE_LIFT = 14
+STATE_RHO = 15
+STATE_BRAKING_ENERGY = 16
+STATE_VARIABLE_NAMES = (
+    "time",
+    "thrust",
+    "incidence",
+    "pitch",
+    "altitude",
+    "lift_coefficient",
+    "drag_coefficient",
+    "ground_distance",
+    "velocity",
+    "acceleration",
+    "pitch_derivative",
+    "ground_reaction_force",
+    "ground_friction_force",
+    "drag",
+    "lift",
+    "rho",
+    "braking_energy",
+)
+
+# Number of points used to tabulate the aerodynamic coefficients and the atmosphere during the take off
+TAKE_OFF_TABLE_SIZE = 256
+
+#############
+# Functions #
+#############
+
+def _compute_uniform_grid_inverse_step(grid: np.ndarray) -> float:
+    """
+    Compute the inverse of the step of a uniform grid.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        Uniform grid.
+
+    Returns
+    -------
+    float
+        Inverse of the step, zero if the grid is degenerated.
+    """
+
+    if grid.size < 2 or grid[-1] == grid[0]:
+        return 0.
+
+    return (grid.size - 1) / (grid[-1] - grid[0])
+
+@njit(cache=True, fastmath=True)
+def _interpolate_on_uniform_grid(x: float, x_0: float, inv_dx: float, y_table: np.ndarray) -> float:
+    """
+    Linearly interpolate a table defined on a uniform grid. The values outside of the grid are clamped.
+
+    Parameters
+    ----------
+    x : float
+        Point where to interpolate.
+    x_0 : float
+        First point of the grid.
+    inv_dx : float
+        Inverse of the step of the grid.
+    y_table : np.ndarray
+        Values on the grid.
+
+    Returns
+    -------
+    float
+        Interpolated value.
+    """
+
+    position = (x - x_0) * inv_dx
+    last_index = y_table.shape[0] - 1
+    if position <= 0:
+        return y_table[0]
+    if position >= last_index:
+        return y_table[last_index]
+    index = int(position)
+    weight = position - index
+
+    return y_table[index] + weight * (y_table[index + 1] - y_table[index])
+
+@njit(cache=True, fastmath=True)
+def _take_off_kernel(
+        phase_array: np.ndarray,
+        state: np.ndarray,
+        time_table: np.ndarray,
+        thrust_factor_table: np.ndarray,
+        incidence_inv_step: float,
+        lift_coefficient_table: np.ndarray,
+        drag_coefficient_table: np.ndarray,
+        altitude_table: np.ndarray,
+        altitude_inv_step: float,
+        max_thrust_table: np.ndarray,
+        rho_table: np.ndarray,
+        P: float,
+        m: float,
+        S: float,
+        alpha_stall: float,
+        ground_friction_coefficient: float,
+        rotation_sequence_trigger_speed: float,
+        ground_rotation_speed: float,
+        air_rotation_speed: float,
+        end_take_off_altitude: float,
+        dt: float,
+        adaptive_time_step: bool,
+        max_time_step_factor: int,
+        time_step_tolerance: float):
+    """
+    Integrate the take off maneuver in the given preallocated phase and state arrays.
+
+    The first column of the state must contain the initial conditions. The time and thrust factor tables
+    contain the time and the thrust evolution factor on the grid of time step dt.
+    The aerodynamic coefficients are interpolated in tables defined on a uniform incidence grid starting at zero,
+    and the maximum thrust and the air density in tables defined on a uniform altitude grid.
+
+    When the adaptive time step is enabled, the time step is a power of two multiple of dt. It is doubled
+    (up to the max factor) when the relative variation of the acceleration over a step is below the tolerance,
+    halved when it is above ten times the tolerance and reset to dt on phase transitions.
+
+    Returns
+    -------
+    tuple[int,float,float]
+        Number of time steps filled, rotation start time and flight start time (negative if not reached).
+    """
+
+    nb_max_iterations = state.shape[1]
+    ground_altitude = altitude_table[0]
+    ground_rotation_step = ground_rotation_speed * dt
+    air_rotation_step = air_rotation_speed * dt
+    rotation_start_time = -1.
+    flight_start_time = -1.
+    grid_index = 0
+    step_factor = 1
+
+    i = 1
+    while state[STATE_ALTITUDE, i - 1] < end_take_off_altitude and grid_index + 1 < nb_max_iterations:
+        previous_velocity = state[STATE_VELOCITY, i - 1]
+        previous_altitude = state[STATE_ALTITUDE, i - 1]
+        previous_incidence = state[STATE_INCIDENCE, i - 1]
+
+        # Determine the phase
+        previous_phase = phase_array[i - 1]
+        if previous_velocity > rotation_sequence_trigger_speed and state[STATE_GROUND_REACTION_FORCE, i - 1] <= 0:
+            current_phase = TAKE_OFF_FLIGHT
+        elif previous_velocity > rotation_sequence_trigger_speed:
+            current_phase = TAKE_OFF_ROTATION
+        else:
+            current_phase = TAKE_OFF_INITIAL_ACCELERATION
+
+        # Compute time, with the base time step during the rotation, on phase transitions and when the rotation
+        # is about to be triggered
+        if current_phase != previous_phase or current_phase == TAKE_OFF_ROTATION:
+            step_factor = 1
+        while step_factor > 1 and current_phase == TAKE_OFF_INITIAL_ACCELERATION and \
+                previous_velocity + state[STATE_ACCELERATION, i - 1] * step_factor * dt > rotation_sequence_trigger_speed:
+            step_factor //= 2
+        step_factor = min(step_factor, nb_max_iterations - 1 - grid_index)
+        grid_index += step_factor
+        current_time = time_table[grid_index]
+        current_dt = step_factor * dt
+
+        # Store the phases start times
+        if current_phase == TAKE_OFF_FLIGHT and previous_phase == TAKE_OFF_ROTATION:
+            flight_start_time = current_time
+        elif current_phase == TAKE_OFF_ROTATION and previous_phase == TAKE_OFF_INITIAL_ACCELERATION:
+            rotation_start_time = current_time
+
+        # Compute thrust
+        current_thrust = _interpolate_on_uniform_grid(
+            previous_altitude, ground_altitude, altitude_inv_step, max_thrust_table) * thrust_factor_table[grid_index]
+
+        # Compute angle of incidence
+        current_incidence = min(previous_incidence + step_factor * (ground_rotation_step * (current_phase == TAKE_OFF_ROTATION) +
+                                air_rotation_step * (current_phase == TAKE_OFF_FLIGHT)), alpha_stall)
+
+        # Compute pitch
+        if current_phase == TAKE_OFF_FLIGHT:
+            current_pitch = state[STATE_PITCH, i - 1] + \
+                state[STATE_PITCH_DERIVATIVE, i - 1] * current_dt
+        else:
+            current_pitch = 0.
+
+        # Compute the trigonometric functions of the angles
+        cos_incidence = cos(current_incidence)
+        sin_incidence = sin(current_incidence)
+        cos_pitch = cos(current_pitch)
+        sin_pitch = sin(current_pitch)
+
+        # Compute aerodynamic coefficients
+        current_lift_coefficient = _interpolate_on_uniform_grid(
+            current_incidence, 0., incidence_inv_step, lift_coefficient_table)
+        current_drag_coefficient = _interpolate_on_uniform_grid(
+            current_incidence, 0., incidence_inv_step, drag_coefficient_table)
+
+        # Compute rho
+        current_rho = _interpolate_on_uniform_grid(
+            previous_altitude, ground_altitude, altitude_inv_step, rho_table)
+
+        # Compute drag and lift with the coefficients of the previous step, sharing the dynamic pressure
+        dynamic_pressure = .5 * current_rho * previous_velocity * previous_velocity * S
+        current_drag = dynamic_pressure * state[STATE_DRAG_COEFFICIENT, i - 1]
+        current_lift = dynamic_pressure * state[STATE_LIFT_COEFFICIENT, i - 1]
+
+        # Compute pitch derivative
+        vertical_force = (P * cos_pitch -
+                          current_lift - current_thrust * sin_incidence)
+        if current_phase == TAKE_OFF_FLIGHT:
+            current_pitch_derivative = -vertical_force / (m * previous_velocity)
+        else:
+            current_pitch_derivative = 0.
+
+        # Compute ground reaction and friction forces
+        if current_phase == TAKE_OFF_FLIGHT:
+            current_ground_reaction_force = 0.
+        else:
+            current_ground_reaction_force = max(vertical_force, 0.)
+        current_ground_friction_force = current_ground_reaction_force * \
+            ground_friction_coefficient
+
+        # Compute acceleration
+        if current_phase == TAKE_OFF_FLIGHT:
+            current_acceleration = (current_thrust * cos_incidence -
+                                    current_drag - P * sin_pitch) / m
+        else:
+            current_acceleration = (current_thrust * cos_incidence -
+                                    current_drag - current_ground_friction_force) / m
+
+        # Compute velocity, distance and altitude
+        current_velocity = previous_velocity + current_acceleration * current_dt
+        current_ground_distance = state[STATE_GROUND_DISTANCE, i - 1] + \
+            current_velocity * current_dt * cos_pitch
+        current_altitude = previous_altitude + \
+            current_velocity * current_dt * sin_pitch
+
+        # Adapt the time step to the relative variation of the acceleration
+        if adaptive_time_step:
+            acceleration_variation = abs(
+                current_acceleration - state[STATE_ACCELERATION, i - 1])
+            if acceleration_variation < time_step_tolerance * abs(current_acceleration):
+                step_factor = min(2 * step_factor, max_time_step_factor)
+            elif acceleration_variation > 10 * time_step_tolerance * abs(current_acceleration):
+                step_factor = max(step_factor // 2, 1)
+
+        # Store the variables
+        phase_array[i] = current_phase
+        state[STATE_TIME, i] = current_time
+        state[STATE_THRUST, i] = current_thrust
+        state[STATE_INCIDENCE, i] = current_incidence
+        state[STATE_PITCH, i] = current_pitch
+        state[STATE_ALTITUDE, i] = current_altitude
+        state[STATE_LIFT_COEFFICIENT, i] = current_lift_coefficient
+        state[STATE_DRAG_COEFFICIENT, i] = current_drag_coefficient
+        state[STATE_GROUND_DISTANCE, i] = current_ground_distance
+        state[STATE_VELOCITY, i] = current_velocity
+        state[STATE_ACCELERATION, i] = current_acceleration
+        state[STATE_PITCH_DERIVATIVE, i] = current_pitch_derivative
+        state[STATE_GROUND_REACTION_FORCE, i] = current_ground_reaction_force
+        state[STATE_GROUND_FRICTION_FORCE, i] = current_ground_friction_force
+        state[STATE_DRAG, i] = current_drag
+        state[STATE_LIFT, i] = current_lift
+        state[STATE_RHO, i] = current_rho
+        i += 1
+
+    return i, rotation_start_time, flight_start_time
+
+@njit(cache=True, parallel=True)
+def _take_off_sweep_kernel(
+        phase_arrays: np.ndarray,
+        states: np.ndarray,
+        time_table: np.ndarray,
+        thrust_factor_table: np.ndarray,
+        incidence_inv_step: float,
+        lift_coefficient_table: np.ndarray,
+        drag_coefficient_table: np.ndarray,
+        altitude_table: np.ndarray,
+        altitude_inv_step: float,
+        max_thrust_table: np.ndarray,
+        rho_table: np.ndarray,
+        P_array: np.ndarray,
+        m_array: np.ndarray,
+        S: float,
+        alpha_stall: float,
+        ground_friction_coefficient_array: np.ndarray,
+        rotation_sequence_trigger_speed_array: np.ndarray,
+        ground_rotation_speed: float,
+        air_rotation_speed: float,
+        end_take_off_altitude: float,
+        dt: float,
+        adaptive_time_step: bool,
+        max_time_step_factor: int,
+        time_step_tolerance: float):
+    """
+    Integrate independent take off maneuvers in parallel, one per row of the phase arrays and per first
+    index of the states. The weight, mass, ground friction coefficient and rotation trigger speed are given
+    per run, the other arguments are shared and identical to the ones of the take off kernel.
+
+    Returns
+    -------
+    tuple[np.ndarray,np.ndarray,np.ndarray]
+        Number of time steps filled, rotation start time and flight start time of each run.
+    """
+
+    nb_runs = states.shape[0]
+    nb_steps_array = np.zeros(nb_runs, dtype=np.int64)
+    rotation_start_time_array = np.empty(nb_runs)
+    flight_start_time_array = np.empty(nb_runs)
+
+    for k in prange(nb_runs):
+        nb_steps, rotation_start_time, flight_start_time = _take_off_kernel(
+            phase_arrays[k],
+            states[k],
+            time_table,
+            thrust_factor_table,
+            incidence_inv_step,
+            lift_coefficient_table,
+            drag_coefficient_table,
+            altitude_table,
+            altitude_inv_step,
+            max_thrust_table,
+            rho_table,
+            P_array[k],
+            m_array[k],
+            S,
+            alpha_stall,
+            ground_friction_coefficient_array[k],
+            rotation_sequence_trigger_speed_array[k],
+            ground_rotation_speed,
+            air_rotation_speed,
+            end_take_off_altitude,
+            dt,
+            adaptive_time_step,
+            max_time_step_factor,
+            time_step_tolerance
+        )
+        nb_steps_array[k] = nb_steps
+        rotation_start_time_array[k] = rotation_start_time
+        flight_start_time_array[k] = flight_start_time
+
+    return nb_steps_array, rotation_start_time_array, flight_start_time_array
+
+def _warm_up_take_off_kernel():
+    """
+    Call the take off kernel on a tiny problem with the argument types of a real call,
+    in order to compile it (or load it from the numba cache) once at import.
+    """
+
+    table = np.linspace(0., 1., 2)
+    _take_off_kernel(
+        np.zeros(2, dtype=np.int8),
+        np.zeros((len(STATE_VARIABLE_NAMES), 2), dtype=TakeOffManeuver.dtype),
+        table,
+        table,
+        1.,
+        table,
+        table,
+        table,
+        1.,
+        table,
+        table,
+        1.,
+        1.,
+        1.,
+        1.,
+        0.,
+        1.,
+        1.,
+        1.,
+        1.,
+        1.,
+        False,
+        1,
+        1.
+    )
 
 ###########
 # Classes #
@@ -32,9 +450,23 @@ class Maneuver(ABC):
     """
 
     plane_model: Plane
-    time_list: list[float]
+    time_list: np.ndarray
     evolution_variable_names: list[str]
     evolution_variable_units: dict[str, str]
+    state: np.ndarray
+    nb_steps: int = 0
+    dtype: type = np.float64
+    # Names of the state variables computed by the maneuver, the other rows of the shared state layout being unused
+    _state_variables: tuple[str, ...] = ()
+
+    def __getattr__(self, name: str):
+        # Give access to the rows of the state with the *_list attributes, trimmed to the number of steps computed
+        if name.endswith("_list") and "state" in self.__dict__:
+            variable = name[:-len("_list")]
+            if variable in self._state_variables:
+                return self.state[STATE_VARIABLE_NAMES.index(variable), :self.nb_steps]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
     def plot_graph(self, variable: str, **kwargs):
         """
@@ -53,7 +485,7 @@ class Maneuver(ABC):
         # Plot
         plot_graph(
             x_array=self.time_list,
-            y_array=self.__getattribute__(f"{variable}_list"),
+            y_array=getattr(self, f"{variable}_list"),
             title=f"{variable.capitalize()} graph",
             data_label=variable,
             use_legend=True,
@@ -62,6 +494,47 @@ class Maneuver(ABC):
             **kwargs
         )
 
+    def _allocate_state(self, nb_max_iterations: int):
+        """
+        Allocate the phase and state arrays, the state having the dtype of the maneuver. The time row is filled
+        and the thrust row contains the thrust evolution factor at each time step. Both are also kept in float64
+        in the time and thrust factor tables, whatever the dtype of the state.
+
+        Parameters
+        ----------
+        nb_max_iterations : int
+            Maximum number of iterations.
+        """
+
+        nb_max_iterations = max(nb_max_iterations, 1)
+        self.phase_id_array = np.zeros(nb_max_iterations, dtype=np.int8)
+        self.state = np.zeros(
+            (len(STATE_VARIABLE_NAMES), nb_max_iterations), dtype=self.dtype)
+        self._time_table = np.zeros(nb_max_iterations)
+        self._time_table[1:] = np.cumsum(
+            np.full(nb_max_iterations - 1, self.dt, dtype=np.float64))
+        self._thrust_factor_table = np.array(
+            [self.thrust_evolution_function(t) for t in self._time_table], dtype=np.float64)
+        self.state[STATE_TIME] = self._time_table
+        self.state[STATE_THRUST] = self._thrust_factor_table
+        self.nb_steps = 1
+
+    def _store_nb_steps(self, nb_steps: int, phase_names: tuple[str]):
+        """
+        Store the number of steps computed and decode the phases ids into their names.
+
+        Parameters
+        ----------
+        nb_steps : int
+            Number of steps computed.
+        phase_names : tuple[str]
+            Names of the phases, indexed by their ids.
+        """
+
+        self.nb_steps = nb_steps
+        self.phase_list = [phase_names[phase]
+                           for phase in self.phase_id_array[:nb_steps]]
+
     @abstractmethod
     def compute_evolution(self) -> None:
         """
@@ -125,11 +598,17 @@ class TakeOffManeuver(Maneuver):
         "drag": "N",
         "rho": "kg.m-3"
     }
+    _state_variables = tuple(
+        variable for variable in STATE_VARIABLE_NAMES if variable != "braking_energy")
 
     rotation_start_time: float | None = None
     flight_start_time: float | None = None
     dt: float = 0.1
     nb_max_iterations: int = 1000
+    adaptive_time_step: bool = False
+    max_time_step_factor: int = 8
+    time_step_tolerance: float = 1e-2
+    dtype: type = np.float32
 
     def __init__(self,
                  plane_model: Plane,
@@ -140,7 +619,8 @@ class TakeOffManeuver(Maneuver):
                  ground_friction_coefficient: float = 0.03,
                  max_ground_angle_of_incidence: float = 12 * np.pi / 180,
                  ground_altitude: float = 0.,
-                 end_take_off_altitude: float | None = None):
+                 end_take_off_altitude: float | None = None,
+                 dtype: type = np.float32):
 
         self.plane_model = plane_model
         self.ground_rotation_speed = rotation_speed
@@ -151,32 +631,45 @@ class TakeOffManeuver(Maneuver):
         self.ground_altitude = ground_altitude
         if end_take_off_altitude is None:
             self.end_take_off_altitude = ground_altitude + 30
+        else:
+            self.end_take_off_altitude = end_take_off_altitude
+        self.dtype = dtype
 
     def _initialize_evolution_variables(self):
-        self.phase_list = ["initial_acceleration"]
-        self.time_list = [0.]
-        self.thrust_list = [
-            self.thrust_evolution_function(0)]
-        self.incidence_list = [0.]
-        self.pitch_list = [0.]
-        self.altitude_list = [self.ground_altitude]
-        self.lift_coefficient_list = [
-            self.plane_model.C_L(0)]
-        self.drag_coefficient_list = [self.plane_model.C_D_0]
-        self.ground_distance_list = [0.]
-        self.velocity_list = [0.]
-        self.acceleration_list = [0.]
-        self.pitch_derivative_list = [0.]
-        self.ground_reaction_force_list = [
-            self.plane_model.P]
-        self.ground_friction_force_list = [
-            self.plane_model.P * self.ground_friction_coefficient]
-        self.drag_list = [self.plane_model.compute_drag(
-            0, z=self.ground_altitude, alpha=0)]
-        self.lift_list = [self.plane_model.compute_lift(
-            0, z=self.ground_altitude, alpha=0)]
-        self.rho_list = [self.plane_model.atmosphere_model.compute_density_from_altitude(
-            self.ground_altitude)]
+        atmosphere_model = self.plane_model.atmosphere_model
+
+        # Preallocate the arrays
+        self._allocate_state(self.nb_max_iterations)
+
+        # Set the initial conditions
+        state = self.state
+        state[STATE_ALTITUDE, 0] = self.ground_altitude
+        state[STATE_LIFT_COEFFICIENT, 0] = self.plane_model.C_L(0)
+        state[STATE_DRAG_COEFFICIENT, 0] = self.plane_model.C_D_0
+        state[STATE_GROUND_REACTION_FORCE, 0] = self.plane_model.P
+        state[STATE_GROUND_FRICTION_FORCE, 0] = self.plane_model.P * \
+            self.ground_friction_coefficient
+        state[STATE_DRAG, 0], state[STATE_LIFT, 0] = self.plane_model.compute_drag_and_lift(
+            0, z=self.ground_altitude, alpha=0)
+
+        # Tabulate the aerodynamic coefficients on the incidence range of the take off
+        self.plane_model.update_k()
+        self._incidence_table = np.linspace(
+            0, self.plane_model.alpha_stall, TAKE_OFF_TABLE_SIZE)
+        self._lift_coefficient_table = np.asarray(
+            self.plane_model.C_L(self._incidence_table), dtype=np.float64)
+        self._drag_coefficient_table = np.asarray(
+            self.plane_model.C_D(self._incidence_table), dtype=np.float64)
+
+        # Tabulate the maximum thrust and the air density on the altitude range of the take off
+        # (the atmosphere models accept arrays, so each table is evaluated in a single call)
+        self._altitude_table = np.linspace(
+            self.ground_altitude, self.end_take_off_altitude, TAKE_OFF_TABLE_SIZE)
+        self._max_thrust_table = np.asarray(
+            self.plane_model.compute_thrust(self._altitude_table), dtype=np.float64)
+        self._rho_table = np.asarray(
+            atmosphere_model.compute_density_from_altitude(self._altitude_table), dtype=np.float64)
+        state[STATE_RHO, 0] = self._rho_table[0]
 
         # Reset timers
         self.rotation_start_time = None
@@ -187,121 +680,132 @@ class TakeOffManeuver(Maneuver):
         # Initialise
         self._initialize_evolution_variables()
 
-        # Iterate until lift off
-        while self.altitude_list[-1] < self.end_take_off_altitude and len(self.phase_list) < self.nb_max_iterations:
-            # Compute time
-            current_time = self.time_list[-1] + self.dt
-
-            # Determine the phase
-            if self.velocity_list[-1] > self.rotation_sequence_trigger_speed and self.ground_reaction_force_list[-1] <= 0:
-                current_phase = "flight"
-                if self.phase_list[-1] == "rotation":
-                    self.flight_start_time = current_time
-            elif self.velocity_list[-1] > self.rotation_sequence_trigger_speed:
-                current_phase = "rotation"
-                if self.phase_list[-1] == "initial_acceleration":
-                    self.rotation_start_time = current_time
-            else:
-                current_phase = "initial_acceleration"
-
-            # Compute thrust
-            current_thrust = self.plane_model.compute_thrust(self.altitude_list[-1]) * \
-                self.thrust_evolution_function(current_time)
-
-            # Compute angle of incidence
-            current_incidence = min(self.incidence_list[-1] + self.ground_rotation_speed * self.dt * (
-                current_phase == "rotation") + self.air_rotation_speed * self.dt * (current_phase == "flight"), self.plane_model.alpha_stall)
+        # Integrate
+        nb_steps, rotation_start_time, flight_start_time = _take_off_kernel(
+            self.phase_id_array,
+            self.state,
+            self._time_table,
+            self._thrust_factor_table,
+            float(_compute_uniform_grid_inverse_step(self._incidence_table)),
+            self._lift_coefficient_table,
+            self._drag_coefficient_table,
+            self._altitude_table,
+            float(_compute_uniform_grid_inverse_step(self._altitude_table)),
+            self._max_thrust_table,
+            self._rho_table,
+            float(self.plane_model.P),
+            float(self.plane_model.m),
+            float(self.plane_model.S),
+            float(self.plane_model.alpha_stall),
+            float(self.ground_friction_coefficient),
+            float(self.rotation_sequence_trigger_speed),
+            float(self.ground_rotation_speed),
+            float(self.air_rotation_speed),
+            float(self.end_take_off_altitude),
+            float(self.dt),
+            bool(self.adaptive_time_step),
+            int(self.max_time_step_factor),
+            float(self.time_step_tolerance)
+        )
 
-            # Compute pitch
-            if current_phase == "flight":
-                current_pitch = self.pitch_list[-1] + \
-                    self.pitch_derivative_list[-1] * self.dt
-            else:
-                current_pitch = 0
+        # Store the results, trimmed to the number of steps computed
+        if rotation_start_time >= 0:
+            self.rotation_start_time = float(rotation_start_time)
+        if flight_start_time >= 0:
+            self.flight_start_time = float(flight_start_time)
+        self._store_nb_steps(nb_steps, TAKE_OFF_PHASE_NAMES)
+
+    def sweep(self,
+              ground_friction_coefficient: float | np.ndarray | None = None,
+              rotation_sequence_trigger_speed: float | np.ndarray | None = None,
+              mass: float | np.ndarray | None = None) -> dict[str, np.ndarray]:
+        """
+        Compute the take off for a set of parameters, the runs being integrated in parallel when numba is installed.
 
-            # Compute lift coefficient
-            current_lift_coefficient = self.plane_model.C_L(current_incidence)
-
-            # Compute drag coefficient
-            current_drag_coefficient = self.plane_model.C_D(current_incidence)
-
-            # Compute rho
-            current_rho = self.plane_model.atmosphere_model.compute_density_from_altitude(
-                self.altitude_list[-1])
-
-            # Compute drag
-            current_drag = self.plane_model.compute_drag(
-                v=self.velocity_list[-1],
-                z=self.altitude_list[-1],
-                alpha=self.incidence_list[-1]
-            )
-
-            # Compute lift
-            current_lift = self.plane_model.compute_lift(
-                v=self.velocity_list[-1],
-                z=self.altitude_list[-1],
-                alpha=self.incidence_list[-1]
-            )
-
-            # Compute pitch derivative
-            vertical_force = (self.plane_model.P * np.cos(current_pitch) -
-                              current_lift - current_thrust * np.sin(current_incidence))
-            if current_phase == "flight":
-                current_pitch_derivative = -vertical_force / \
-                    (self.plane_model.m * self.velocity_list[-1])
-            else:
-                current_pitch_derivative = 0
+        Parameters
+        ----------
+        ground_friction_coefficient : float | np.ndarray | None, optional
+            Ground friction coefficients of the runs, by default the one of the maneuver.
+        rotation_sequence_trigger_speed : float | np.ndarray | None, optional
+            Rotation trigger speeds of the runs in m.s-1, by default the one of the maneuver.
+        mass : float | np.ndarray | None, optional
+            Masses of the plane for the runs in kg, by default the one of the plane.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Dictionary containing a 2D array of shape (nb_runs, nb_max_iterations) for the phase ids and for
+            each evolution variable, and the arrays of the number of steps, rotation start time and flight
+            start time of each run (NaN if not reached).
 
-            # Compute ground reaction force
-            if current_phase == "flight":
-                current_ground_reaction_force = 0
-            else:
-                current_ground_reaction_force = max(vertical_force, 0)
+        Note
+        ----
+        The parameters are broadcast together. The values of a run beyond its number of steps are not meaningful.
+        The evolution previously computed with compute_evolution is reset.
+        """
 
-            # Compute ground friction force
-            current_ground_friction_force = current_ground_reaction_force * \
-                self.ground_friction_coefficient
+        # Broadcast the parameters of the runs
+        if ground_friction_coefficient is None:
+            ground_friction_coefficient = self.ground_friction_coefficient
+        if rotation_sequence_trigger_speed is None:
+            rotation_sequence_trigger_speed = self.rotation_sequence_trigger_speed
+        if mass is None:
+            mass = self.plane_model.m
+        ground_friction_coefficient, rotation_sequence_trigger_speed, mass = [
+            np.ascontiguousarray(array, dtype=np.float64) for array in np.broadcast_arrays(
+                np.atleast_1d(ground_friction_coefficient),
+                np.atleast_1d(rotation_sequence_trigger_speed),
+                np.atleast_1d(mass))]
+        weight = mass * self.plane_model.environment_model.g
+        nb_runs = mass.size
+
+        # Initialise one state per run
+        self._initialize_evolution_variables()
+        phase_arrays = np.repeat(self.phase_id_array[None, :], nb_runs, axis=0)
+        states = np.repeat(self.state[None, :, :], nb_runs, axis=0)
+        states[:, STATE_GROUND_REACTION_FORCE, 0] = weight
+        states[:, STATE_GROUND_FRICTION_FORCE, 0] = weight * \
+            ground_friction_coefficient
+
+        # Integrate
+        nb_steps, rotation_start_time, flight_start_time = _take_off_sweep_kernel(
+            phase_arrays,
+            states,
+            self._time_table,
+            self._thrust_factor_table,
+            float(_compute_uniform_grid_inverse_step(self._incidence_table)),
+            self._lift_coefficient_table,
+            self._drag_coefficient_table,
+            self._altitude_table,
+            float(_compute_uniform_grid_inverse_step(self._altitude_table)),
+            self._max_thrust_table,
+            self._rho_table,
+            weight,
+            mass,
+            float(self.plane_model.S),
+            float(self.plane_model.alpha_stall),
+            ground_friction_coefficient,
+            rotation_sequence_trigger_speed,
+            float(self.ground_rotation_speed),
+            float(self.air_rotation_speed),
+            float(self.end_take_off_altitude),
+            float(self.dt),
+            bool(self.adaptive_time_step),
+            int(self.max_time_step_factor),
+            float(self.time_step_tolerance)
+        )
 
-            # Compute acceleration
-            if current_phase == "flight":
-                current_acceleration = (current_thrust * np.cos(current_incidence) -
-                                        current_drag - self.plane_model.P * np.sin(current_pitch)) / self.plane_model.m
-            else:
-                current_acceleration = (current_thrust * np.cos(current_incidence) -
-                                        current_drag - current_ground_friction_force) / self.plane_model.m
+        # Gather the results
+        results = {
+            "phase": phase_arrays,
+            "nb_steps": nb_steps,
+            "rotation_start_time": np.where(rotation_start_time >= 0, rotation_start_time, np.nan),
+            "flight_start_time": np.where(flight_start_time >= 0, flight_start_time, np.nan)
+        }
+        for variable in self._state_variables:
+            results[variable] = states[:, STATE_VARIABLE_NAMES.index(variable), :]
 
-            # Compute velocity
-            current_velocity = self.velocity_list[-1] + \
-                current_acceleration * self.dt
-
-            # Compute distance
-            current_ground_distance = self.ground_distance_list[-1] + \
-                current_velocity * self.dt * np.cos(current_pitch)
-
-            # Compute altitude
-            current_altitude = self.altitude_list[-1] + \
-                current_velocity * self.dt * np.sin(current_pitch)
-
-            # Add the variables in the lists
-            self.phase_list.append(current_phase)
-            self.time_list.append(current_time)
-            self.thrust_list.append(current_thrust)
-            self.incidence_list.append(current_incidence)
-            self.pitch_list.append(current_pitch)
-            self.lift_coefficient_list.append(current_lift_coefficient)
-            self.drag_coefficient_list.append(current_drag_coefficient)
-            self.acceleration_list.append(current_acceleration)
-            self.velocity_list.append(current_velocity)
-            self.ground_distance_list.append(current_ground_distance)
-            self.rho_list.append(current_rho)
-            self.pitch_derivative_list.append(current_pitch_derivative)
-            self.drag_list.append(current_drag)
-            self.lift_list.append(current_lift)
-            self.altitude_list.append(current_altitude)
-            self.ground_reaction_force_list.append(
-                current_ground_reaction_force)
-            self.ground_friction_force_list.append(
-                current_ground_friction_force)
+        return results
 
 class LandingManeuver(Maneuver):
     """
@@ -350,10 +854,27 @@ class LandingManeuver(Maneuver):
         "lift": "N",
         "braking_energy": "J"
     }
+    _state_variables = (
+        "time",
+        "thrust",
+        "incidence",
+        "lift_coefficient",
+        "drag_coefficient",
+        "ground_distance",
+        "velocity",
+        "acceleration",
+        "ground_reaction_force",
+        "ground_friction_force",
+        "drag",
+        "lift",
+        "braking_energy"
+    )
 
     braking_start_time: float | None = None
+    stop_time: float | None = None
     dt: float = 0.1
-    nb_max_iterations: int = 1000
+    nb_max_iterations: int | None = None
+    use_compiled_kernel: bool = True
 
     def __init__(self,
                  plane_model: Plane,
@@ -384,124 +905,301 @@ class LandingManeuver(Maneuver):
             raise Warning(
                 "Warning, one of the parachute coefficients is zero. The parachute will remain disabled for the sequence.")
 
-    def _initialize_evolution_variables(self):
-        self.phase_list = ["initial_touchdown"]
-        self.time_list = [0.]
-        self.thrust_list = [
-            self.thrust_evolution_function(0)]
-        self.incidence_list = [self.initial_incidence]
-        self.lift_coefficient_list = [
-            self.plane_model.C_L(0)]
-        self.drag_coefficient_list = [self.plane_model.C_D_0]
-        self.ground_distance_list = [0.]
-        self.velocity_list = [self.initial_velocity]
-        self.acceleration_list = [0.]
-        self.ground_reaction_force_list = [0.]
-        self.ground_friction_force_list = [0.]
+    def _initialize_evolution_variables(self, nb_max_iterations: int | None = None):
+
+        # Preallocate the arrays
+        if nb_max_iterations is None:
+            nb_max_iterations = self._get_nb_max_iterations()
+        self._allocate_state(nb_max_iterations)
+
+        # Set the initial conditions
+        state = self.state
+        state[STATE_INCIDENCE, 0] = self.initial_incidence
+        state[STATE_LIFT_COEFFICIENT, 0] = self.plane_model.C_L(0)
+        state[STATE_DRAG_COEFFICIENT, 0] = self.plane_model.C_D_0
+        state[STATE_VELOCITY, 0] = self.initial_velocity
+
+        # Compute the air density once, the altitude being constant during the landing
         rho = self.plane_model.atmosphere_model.compute_density_from_altitude(
             self.ground_altitude)
-        self.drag_list = [self.plane_model.compute_drag(
-            self.initial_velocity, z=self.ground_altitude, alpha=self.initial_incidence) + .5 * rho * np.power(self.velocity_list[-1], 2) * self.parachute_drag_coefficient * self.parachute_reference_surface]
-        self.lift_list = [self.plane_model.compute_lift(
-            self.initial_velocity, z=self.ground_altitude, alpha=self.initial_incidence)]
-        self.braking_energy_list = [0.]
+        self._rho = rho
+        state[STATE_DRAG, 0], state[STATE_LIFT, 0] = self.plane_model.compute_drag_and_lift(
+            self.initial_velocity, z=self.ground_altitude, alpha=self.initial_incidence)
+        state[STATE_DRAG, 0] += .5 * rho * np.power(self.initial_velocity, 2) * \
+            self.parachute_drag_coefficient * self.parachute_reference_surface
 
         # Reset timers
         self.braking_start_time = None
         self.stop_time = None
 
-    def compute_evolution(self):
-        # Initialise
-        self._initialize_evolution_variables()
+    def _get_nb_max_iterations(self) -> int:
+        """
+        Get the maximum number of iterations. If it is not defined, it is estimated from the time needed to stop
+        the plane with a deceleration of 0.1 g, with a minimum of LANDING_MIN_NB_ITERATIONS.
 
-        # Compute air density
-        rho = self.plane_model.atmosphere_model.compute_density_from_altitude(
-            self.ground_altitude)
+        Returns
+        -------
+        int
+            Maximum number of iterations.
+        """
+
+        if self.nb_max_iterations is not None:
+            return self.nb_max_iterations
+
+        expected_deceleration = 0.1 * self.plane_model.environment_model.g
+        nb_max_iterations = max(int(
+            self.initial_velocity / expected_deceleration / self.dt) + 100, LANDING_MIN_NB_ITERATIONS)
+
+        return nb_max_iterations
 
-        # Iterate until lift off
-        while self.phase_list[-1] != "stopped" and len(self.phase_list) < self.nb_max_iterations:
+    def compute_evolution(self, early_exit_tol: float = 1e-3):
+        """
+        Compute the evolution of variables during the maneuver.
+
+        Parameters
+        ----------
+        early_exit_tol : float, optional
+            The plane is considered as stopped when the sum of its velocity and of the absolute value of its
+            acceleration falls below this value, by default 1e-3
+
+        Note
+        ----
+        When nb_max_iterations is not defined, the estimated number of iterations is doubled and the landing
+        computed again as long as the plane is still decelerating at the last step, up to LANDING_MAX_NB_ITERATIONS.
+        """
+
+        nb_max_iterations = self._get_nb_max_iterations()
+        while True:
+            # Initialise
+            self._initialize_evolution_variables(nb_max_iterations)
+
+            # Use the compiled kernel if it has been built and supports the aerodynamic model of the plane
+            if self._can_use_compiled_kernel():
+                nb_steps = self._compute_evolution_with_compiled_kernel(
+                    early_exit_tol)
+            else:
+                nb_steps = self._compute_evolution_with_python(
+                    early_exit_tol)
+
+            # Stop once the plane is at rest, or if the number of iterations cannot be increased
+            is_stopped = self.phase_id_array[nb_steps - 1] == LANDING_STOPPED
+            is_decelerating = self.state[STATE_ACCELERATION, nb_steps - 1] < 0
+            if is_stopped or not is_decelerating or self.nb_max_iterations is not None or \
+                    nb_max_iterations >= LANDING_MAX_NB_ITERATIONS:
+                break
+            nb_max_iterations = min(
+                2 * nb_max_iterations, LANDING_MAX_NB_ITERATIONS)
+
+        # Store the number of steps computed
+        self._store_nb_steps(nb_steps, LANDING_PHASE_NAMES)
+
+    def _compute_evolution_with_python(self, early_exit_tol: float) -> int:
+        """
+        Compute the evolution of variables in pure Python, in the preallocated state.
+
+        Parameters
+        ----------
+        early_exit_tol : float
+            Tolerance used to consider that the plane is stopped.
+
+        Returns
+        -------
+        int
+            Number of time steps computed.
+        """
+
+        # Bind the quantities that are constant during the maneuver
+        rho = self._rho
+        P = self.plane_model.P
+        m = self.plane_model.m
+        dt = self.dt
+        ground_altitude = self.ground_altitude
+        max_thrust = self.plane_model.compute_thrust(ground_altitude)
+        rotation_step = self.ground_rotation_speed * dt
+        braking_friction_coefficient = self.braking_friction_coefficient
+        total_friction_coefficient = self.ground_friction_coefficient + \
+            braking_friction_coefficient
+        S = self.plane_model.S
+        parachute_drag_coefficient = self.parachute_drag_coefficient * \
+            self.parachute_reference_surface / S
+        C_L = self.plane_model.C_L
+        C_D = self.plane_model.C_D
+
+        # Bind the rows of the state
+        phase_array = self.phase_id_array
+        time_array = self.state[STATE_TIME]
+        thrust_array = self.state[STATE_THRUST]
+        incidence_array = self.state[STATE_INCIDENCE]
+        lift_coefficient_array = self.state[STATE_LIFT_COEFFICIENT]
+        drag_coefficient_array = self.state[STATE_DRAG_COEFFICIENT]
+        lift_array = self.state[STATE_LIFT]
+        drag_array = self.state[STATE_DRAG]
+        ground_reaction_force_array = self.state[STATE_GROUND_REACTION_FORCE]
+        ground_friction_force_array = self.state[STATE_GROUND_FRICTION_FORCE]
+        acceleration_array = self.state[STATE_ACCELERATION]
+        velocity_array = self.state[STATE_VELOCITY]
+        ground_distance_array = self.state[STATE_GROUND_DISTANCE]
+        braking_energy_array = self.state[STATE_BRAKING_ENERGY]
+
+        # Iterate until the plane stops
+        nb_max_iterations = time_array.size
+        i = 1
+        while phase_array[i - 1] != LANDING_STOPPED and i < nb_max_iterations:
             # Compute time
-            current_time = self.time_list[-1] + self.dt
+            current_time = time_array[i]
+            previous_velocity = velocity_array[i - 1]
 
             # Determine the phase
-            if self.velocity_list[-1] <= 0:
-                current_phase = "stopped"
-            elif self.incidence_list[-1] <= 0:
-                current_phase = "braking"
-                if self.phase_list[-1] == "rotation":
+            if previous_velocity <= 0:
+                current_phase = LANDING_STOPPED
+            elif incidence_array[i - 1] <= 0:
+                current_phase = LANDING_BRAKING
+                if phase_array[i - 1] == LANDING_ROTATION:
                     self.braking_start_time = current_time
             else:
-                current_phase = "rotation"
+                current_phase = LANDING_ROTATION
 
             # Compute thrust
-            current_thrust = self.plane_model.compute_thrust(self.ground_altitude) * \
-                self.thrust_evolution_function(current_time)
+            current_thrust = max_thrust * thrust_array[i]
 
             # Compute angle of incidence
             current_incidence = max(
-                self.incidence_list[-1] - self.ground_rotation_speed * self.dt, 0)
+                incidence_array[i - 1] - rotation_step, 0)
 
             # Compute lift coefficient
-            current_lift_coefficient = self.plane_model.C_L(current_incidence)
+            current_lift_coefficient = C_L(current_incidence)
 
             # Compute drag coefficient (including the parachute drag)
-            current_drag_coefficient = self.plane_model.C_D(
-                current_incidence) + self.parachute_reference_surface * self.parachute_drag_coefficient / self.plane_model.S
-
-            # Compute drag (including the parachute drag)
-            current_drag = self.plane_model.compute_drag(
-                v=self.velocity_list[-1],
-                z=self.ground_altitude,
-                alpha=current_incidence
-            ) + .5 * rho * np.power(self.velocity_list[-1], 2) * self.parachute_drag_coefficient * self.parachute_reference_surface
-
-            # Compute lift
-            current_lift = self.plane_model.compute_lift(
-                v=self.velocity_list[-1],
-                z=self.ground_altitude,
-                alpha=current_incidence
-            )
+            current_drag_coefficient = C_D(
+                current_incidence) + parachute_drag_coefficient
+
+            # Compute drag (including the parachute drag) and lift, sharing the dynamic pressure
+            dynamic_pressure = .5 * rho * previous_velocity * previous_velocity * S
+            current_drag = dynamic_pressure * current_drag_coefficient
+            current_lift = dynamic_pressure * current_lift_coefficient
 
             # Compute ground reaction force
-            current_ground_reaction_force = (self.plane_model.P - current_lift -
-                                             current_thrust * np.sin(current_incidence))
+            current_ground_reaction_force = (P - current_lift -
+                                             current_thrust * sin(current_incidence))
 
             # Compute ground friction force
             current_ground_friction_force = current_ground_reaction_force * \
-                (self.ground_friction_coefficient +
-                 self.braking_friction_coefficient)
+                total_friction_coefficient
 
             # Compute acceleration
-            current_acceleration = (current_thrust * np.cos(current_incidence) -
-                                    current_drag - current_ground_friction_force) / self.plane_model.m
+            current_acceleration = (current_thrust * cos(current_incidence) -
+                                    current_drag - current_ground_friction_force) / m
 
             # Compute velocity
-            current_velocity = self.velocity_list[-1] + \
-                current_acceleration * self.dt
+            current_velocity = previous_velocity + current_acceleration * dt
+
+            # Stop the sequence as soon as the plane is at rest
+            if current_velocity <= 0 or abs(current_acceleration) + current_velocity < early_exit_tol:
+                current_phase = LANDING_STOPPED
+                current_velocity = 0.
+                self.stop_time = current_time
 
             # Compute ground distance
-            current_ground_distance = self.ground_distance_list[-1] + \
-                current_velocity * self.dt
+            current_ground_distance = ground_distance_array[i - 1] + \
+                current_velocity * dt
 
             # Compute braking energy
-            current_braking_energy = self.braking_energy_list[-1] + current_ground_reaction_force * \
-                self.braking_friction_coefficient * current_velocity * \
-                self.dt
-
-            # Add the variables in the list
-            self.phase_list.append(current_phase)
-            self.time_list.append(current_time)
-            self.thrust_list.append(current_thrust)
-            self.incidence_list.append(current_incidence)
-            self.lift_coefficient_list.append(current_lift_coefficient)
-            self.drag_coefficient_list.append(current_drag_coefficient)
-            self.lift_list.append(current_lift)
-            self.drag_list.append(current_drag)
-            self.ground_reaction_force_list.append(
-                current_ground_reaction_force)
-            self.ground_friction_force_list.append(
-                current_ground_friction_force)
-            self.acceleration_list.append(current_acceleration)
-            self.velocity_list.append(current_velocity)
-            self.ground_distance_list.append(current_ground_distance)
-            self.braking_energy_list.append(current_braking_energy)
+            current_braking_energy = braking_energy_array[i - 1] + current_ground_reaction_force * \
+                braking_friction_coefficient * current_velocity * dt
+
+            # Store the variables in the arrays
+            phase_array[i] = current_phase
+            thrust_array[i] = current_thrust
+            incidence_array[i] = current_incidence
+            lift_coefficient_array[i] = current_lift_coefficient
+            drag_coefficient_array[i] = current_drag_coefficient
+            lift_array[i] = current_lift
+            drag_array[i] = current_drag
+            ground_reaction_force_array[i] = current_ground_reaction_force
+            ground_friction_force_array[i] = current_ground_friction_force
+            acceleration_array[i] = current_acceleration
+            velocity_array[i] = current_velocity
+            ground_distance_array[i] = current_ground_distance
+            braking_energy_array[i] = current_braking_energy
+            i += 1
+
+        return i
+
+    def _can_use_compiled_kernel(self) -> bool:
+        """
+        Check if the compiled landing kernel can be used. The kernel hardcodes the linear lift and parabolic drag
+        models of Plane, so it is not used when the class or the instance of the plane overrides C_L or C_D.
+
+        Returns
+        -------
+        bool
+            True if the compiled kernel is enabled, built and compatible with the plane.
+        """
+
+        plane_type = type(self.plane_model)
+        plane_attributes = vars(self.plane_model)
+        return self.use_compiled_kernel and compute_landing_evolution is not None and \
+            plane_type.C_L is Plane.C_L and plane_type.C_D is Plane.C_D and \
+            "C_L" not in plane_attributes and "C_D" not in plane_attributes
+
+    def _compute_evolution_with_compiled_kernel(self, early_exit_tol: float) -> int:
+        """
+        Compute the evolution of variables with the compiled landing kernel, in the preallocated state.
+
+        Parameters
+        ----------
+        early_exit_tol : float
+            Tolerance used to consider that the plane is stopped.
+
+        Returns
+        -------
+        int
+            Number of time steps computed.
+        """
+
+        self.plane_model.update_k()
+
+        # Integrate
+        nb_steps, braking_start_time = compute_landing_evolution(
+            self.phase_id_array,
+            self.state[STATE_TIME],
+            self.state[STATE_THRUST],
+            self.state[STATE_INCIDENCE],
+            self.state[STATE_LIFT_COEFFICIENT],
+            self.state[STATE_DRAG_COEFFICIENT],
+            self.state[STATE_GROUND_DISTANCE],
+            self.state[STATE_VELOCITY],
+            self.state[STATE_ACCELERATION],
+            self.state[STATE_GROUND_REACTION_FORCE],
+            self.state[STATE_GROUND_FRICTION_FORCE],
+            self.state[STATE_DRAG],
+            self.state[STATE_LIFT],
+            self.state[STATE_BRAKING_ENERGY],
+            self.plane_model.compute_thrust(self.ground_altitude),
+            self.plane_model.P,
+            self.plane_model.m,
+            self.ground_friction_coefficient,
+            self.braking_friction_coefficient,
+            self.plane_model.S,
+            self._rho,
+            self.plane_model.C_L_alpha,
+            self.plane_model.alpha_0,
+            self.plane_model.C_D_0,
+            self.plane_model.k,
+            self.parachute_drag_coefficient * self.parachute_reference_surface,
+            self.ground_rotation_speed,
+            self.dt,
+            early_exit_tol
+        )
+
+        # Store the timers
+        if braking_start_time >= 0:
+            self.braking_start_time = braking_start_time
+        if self.phase_id_array[nb_steps - 1] == LANDING_STOPPED:
+            self.stop_time = self.state[STATE_TIME, nb_steps - 1]
+
+        return nb_steps
+
+# Compile the take off kernel for the default dtype at import, unless disabled by the environment
+if NUMBA_AVAILABLE and not os.environ.get("FLIGHT_MECH_NO_WARMUP"):
+    _warm_up_take_off_kernel()
@@ -389,6 +389,41 @@ class Plane:
 
         return lift
 
+    def compute_drag_and_lift(self,
+                              v: float,
+                              z: float,
+                              alpha: float | None = None,
+                              C_L: float | None = None) -> tuple[float, float]:
+        """
+        Compute the drag and the lift at a given velocity, altitude and angle of incidence or lift coefficient,
+        sharing the dynamic pressure between both forces.
+
+        Parameters
+        ----------
+        v : float
+            Velocity.
+        z : float
+            Altitude.
+        alpha : float | None, optional
+            Angle of incidence, by default None
+        C_L : float | None, optional
+            Lift coefficient, by default None
+
+        Returns
+        -------
+        tuple[float, float]
+            Drag and lift forces.
+        """
+
+        if C_L is None:
+            C_L = self.C_L(alpha)
+        dynamic_pressure = .5 * self.atmosphere_model.compute_density_from_altitude(z) * \
+            self.S * pow(v, 2)
+        drag = dynamic_pressure * self.C_D(C_L=C_L)
+        lift = dynamic_pressure * C_L
+
+        return drag, lift
+
     def compute_thrust(self, z: float) -> float:
         """
         Compute the thrust at a given altitude.
@@ -1111,8 +1146,7 @@ class Plane:
             C_L = C_L_max
 
         landing_speed = self.compute_landing_speed(z)
-        D = self.compute_drag(landing_speed * 0.7, z, C_L=C_L)
-        L = self.compute_lift(landing_speed * 0.7, z, C_L=C_L)
+        D, L = self.compute_drag_and_lift(landing_speed * 0.7, z, C_L=C_L)
         rho = self.atmosphere_model.compute_density_from_altitude(z)
         d_landing = (1.69 * (self.P / self.S)) / (rho * self.environment_model.g * C_L_max) * \
             (self.P / (reverse_thrust + (D + mu * (self.P - L))))
@@ -8,6 +8,7 @@ Module to define turbo-reactors models and compute their characteristics.
 
 # Python imports #
 
+import math
 from typing import Literal
 
 # Dependencies #
@@ -101,23 +102,21 @@ class _Turbojet:
             value)
         self._ambient_conditions_from_altitude = True
 
-    def plot_graph(self, variable: Literal["pressure", "temperature", "mass_flow"], **kwargs):
+    def _get_stations_values(self, code: str) -> tuple[list[int], list[float]]:
         """
-        Plot the graph of evolution of the given variable in the turbojet.
+        Get the values of a variable at the stations of the turbojet where it is defined.
 
         Parameters
         ----------
-        variable : Literal["pressure", "temperature", "mass_flow"]
-            Name of the variable to plot.
+        code : str
+            Code of the variable.
 
-        Note
-        ----
-        For more details on the optional arguments, please check flight_mech._common.plot_graph.
+        Returns
+        -------
+        tuple[list[int], list[float]]
+            Ids of the stations and values of the variable.
         """
 
-        # Extract code of the variable
-        code = VARIABLE_TO_CODE[variable]
-
         # Allocate list for the x and y values
         values_list = []
         id_list = []
@@ -125,9 +124,29 @@ class _Turbojet:
         # Extract the values
         for i in range(1, 9):
             current_code = code + str(i)
-            if current_code in self.__dir__():
+            if hasattr(type(self), current_code):
                 id_list.append(i)
-                values_list.append(self.__getattribute__(current_code))
+                values_list.append(getattr(self, current_code))
+
+        return id_list, values_list
+
+    def plot_graph(self, variable: Literal["pressure", "temperature", "mass_flow"], **kwargs):
+        """
+        Plot the graph of evolution of the given variable in the turbojet.
+
+        Parameters
+        ----------
+        variable : Literal["pressure", "temperature", "mass_flow"]
+            Name of the variable to plot.
+
+        Note
+        ----
+        For more details on the optional arguments, please check flight_mech._common.plot_graph.
+        """
+
+        # Extract the values
+        id_list, values_list = self._get_stations_values(
+            VARIABLE_TO_CODE[variable])
 
         # Plot
         plot_graph(
@@ -168,176 +187,303 @@ class TurbojetSingleBody(_Turbojet):
                 f"T4 cannot accept negative values ({value}), please provide only positive values.")
         self._T4_instruction = value
 
+    # Define cache variables
+    _stations_state_key: tuple | None = None
+
+    def _get_stations_state_key(self) -> tuple:
+        """
+        Get a key describing all the parameters the stations depend on.
+
+        Returns
+        -------
+        tuple
+            Key of the current state.
+        """
+
+        stations_state_key = (
+            self.mode,
+            self.M0,
+            self.ambient_pressure,
+            self.ambient_temperature,
+            self.compressor_efficiency,
+            self.turbine_efficiency,
+            self.T4_max,
+            self.OPR_design,
+            self.max_reference_surface_mass_flow_rate_4_star,
+            self.A4_star,
+            self.T4_instruction,
+            self.current_OPR,
+            self.fuel.lower_heating_value,
+            air.gamma,
+            air.r
+        )
+
+        return stations_state_key
+
+    def _ensure_solved(self):
+        """
+        Solve the stations if the parameters have changed since the last computation.
+        """
+
+        if self._stations_state_key != self._get_stations_state_key():
+            self._solve_stations()
+
+    def _solve_stations(self):
+        """
+        Compute the pressure, temperature and mass flow of all the stations in one pass and store them in cache.
+        """
+
+        # Retrieve the variables fixed by the design in operation mode
+        if self.mode == "operation":
+            design_M8 = self._get_design_variable("M8")
+            design_A8_star = self._get_design_variable("A8_star")
+            design_A8 = self._get_design_variable("A8")
+
+        # Define the thermodynamic exponents of air once, from its current gamma
+        gamma = air.gamma
+        gamma_m1 = gamma - 1
+        gamma_m1_over_2 = gamma_m1 / 2
+        gamma_over_gamma_m1 = gamma / gamma_m1
+        gamma_m1_over_gamma = gamma_m1 / gamma
+        gamma_p1_over_2gm1 = (gamma + 1) / (2 * gamma_m1)
+        two_over_gamma_p1 = 2 / (gamma + 1)
+
+        # Define the constants of the computation
+        inv_compressor_efficiency = 1 / self.compressor_efficiency
+        inv_turbine_efficiency = 1 / self.turbine_efficiency
+        if self.mode == "design":
+            OPR = self.OPR_design
+            T4 = self.T4_max
+        elif self.mode == "operation":
+            OPR = self.current_OPR
+            T4 = self.T4_instruction
+
+        # Allocate the stations arrays (stations 6 and 7 are not defined)
+        P = np.full(9, np.nan)
+        T = np.full(9, np.nan)
+        W = np.full(9, np.nan)
+
+        # Inlet
+        air.temperature = self.ambient_temperature
+        V0 = self.M0 * air.sound_velocity
+        compression_factor = 1 + gamma_m1_over_2 * self.M0 * self.M0
+        P[0] = self.ambient_pressure * compression_factor ** gamma_over_gamma_m1
+        T[0] = self.ambient_temperature * compression_factor
+        P[1] = P[2] = P[0]
+        T[1] = T[2] = T[0]
+
+        # Compressor
+        P[3] = P[2] * OPR
+        T[3] = T[2] * (1 + inv_compressor_efficiency *
+                       ((P[3] / P[2]) ** gamma_m1_over_gamma - 1))
+
+        # Combustion chamber
+        P[4] = 0.95 * P[3]
+        T[4] = T4
+        W4R = self.max_reference_surface_mass_flow_rate_4_star * self.A4_star
+        W[4] = W4R * (P[4] / REFERENCE_PRESSURE) / \
+            math.sqrt(T[4] / REFERENCE_TEMPERATURE)
+        Wf = (1 / self.fuel.lower_heating_value) * \
+            W[4] * air.Cp * (T[4] - T[3])
+        W[0:4] = W[4] - Wf
+
+        # Turbine
+        T[5] = T[4] - (T[3] - T[2])
+        P[5] = P[4] * (1 - inv_turbine_efficiency *
+                       (1 - (T[5] / T[4]))) ** gamma_over_gamma_m1
+        W[5] = W[4]
+
+        # Nozzle
+        P[8] = P[5]
+        T[8] = T[5]
+        W[8] = W[5]
+        Ps8 = self.ambient_pressure
+        W8R = W[8] * np.sqrt(T[8] / REFERENCE_TEMPERATURE) / \
+            (P[8] / REFERENCE_PRESSURE)
+        if self.mode == "design":
+            M8 = np.sqrt(
+                ((P[8] / Ps8) ** gamma_m1_over_gamma - 1) / gamma_m1_over_2)
+            A8_star = W8R / self.max_reference_surface_mass_flow_rate_4_star
+            A8 = A8_star / M8 * (two_over_gamma_p1 * (
+                1 + gamma_m1_over_2 * M8 * M8)) ** gamma_p1_over_2gm1
+        elif self.mode == "operation":
+            M8 = design_M8
+            A8_star = design_A8_star
+            A8 = design_A8
+        Ts8 = T[8] / (1 + gamma_m1_over_2 * M8 * M8)
+        air.temperature = Ts8
+        V8 = M8 * air.sound_velocity
+
+        # Store the results in cache
+        self._P = P
+        self._T = T
+        self._W = W
+        self._V0 = V0
+        self._W4R = W4R
+        self._Wf = Wf
+        self._Ps8 = Ps8
+        self._W8R = W8R
+        self._M8 = M8
+        self._A8_star = A8_star
+        self._A8 = A8
+        self._Ts8 = Ts8
+        self._V8 = V8
+        self._stations_state_key = self._get_stations_state_key()
+
     @property
     def P0(self):
-        P0 = self.ambient_pressure * \
-            np.power((1 + (air.gamma - 1) / 2 * np.power(self.M0, 2)),
-                     air.gamma / (air.gamma - 1))
-        return P0
+        self._ensure_solved()
+        return self._P[0]
 
     @property
     def V0(self):
-        air.temperature = self.ambient_temperature
-        return self.M0 * air.sound_velocity
+        self._ensure_solved()
+        return self._V0
 
     @property
     def T0(self):
-        T0 = self.ambient_temperature * \
-            (1 + (air.gamma - 1) / 2 * np.power(self.M0, 2))
-        return T0
+        self._ensure_solved()
+        return self._T[0]
 
     @property
     def W0(self):
-        return self.W3
+        self._ensure_solved()
+        return self._W[0]
 
     @property
     def P1(self):
-        return self.P0
+        self._ensure_solved()
+        return self._P[1]
 
     @property
     def T1(self):
-        return self.T0
+        self._ensure_solved()
+        return self._T[1]
 
     @property
     def W1(self):
-        return self.W3
+        self._ensure_solved()
+        return self._W[1]
 
     @property
     def P2(self):
-        return self.P0
+        self._ensure_solved()
+        return self._P[2]
 
     @property
     def T2(self):
-        return self.T0
+        self._ensure_solved()
+        return self._T[2]
 
     @property
     def W2(self):
-        return self.W3
+        self._ensure_solved()
+        return self._W[2]
 
     @property
     def P3(self):
-        if self.mode == "design":
-            return self.P2 * self.OPR_design
-        elif self.mode == "operation":
-            return self.P2 * self.current_OPR
+        self._ensure_solved()
+        return self._P[3]
 
     @property
     def T3(self):
-        T3 = self.T2 * (1 + (1 / self.compressor_efficiency) *
-                        (np.power(self.P3 / self.P2, (air.gamma - 1) / air.gamma) - 1))
-        return T3
+        self._ensure_solved()
+        return self._T[3]
 
     @property
     def W3(self):
-        W3 = self.W4 - self.Wf
-        return W3
+        self._ensure_solved()
+        return self._W[3]
 
     @property
     def P4(self):
-        P4 = 0.95 * self.P3
-        return P4
+        self._ensure_solved()
+        return self._P[4]
 
     @property
     def T4(self):
-        if self.mode == "design":
-            return self.T4_max
-        elif self.mode == "operation":
-            return self.T4_instruction
+        self._ensure_solved()
+        return self._T[4]
 
     @property
     def W4R(self):
-        W4R = self.max_reference_surface_mass_flow_rate_4_star * self.A4_star
-        return W4R
+        self._ensure_solved()
+        return self._W4R
 
     @property
     def W4(self):
-        W4 = self.W4R * (self.P4 / REFERENCE_PRESSURE) / \
-            np.sqrt(self.T4 / REFERENCE_TEMPERATURE)
-        return W4
+        self._ensure_solved()
+        return self._W[4]
 
     @property
     def Wf(self):
-        Wf = (1 / self.fuel.lower_heating_value) * \
-            self.W4 * air.Cp * (self.T4 - self.T3)
-        return Wf
+        self._ensure_solved()
+        return self._Wf
 
     @property
     def P5(self):
-        P5 = self.P4 * np.power(1 - (1 / self.turbine_efficiency)
-                                * (1 - (self.T5 / self.T4)), air.gamma / (air.gamma - 1))
-        return P5
+        self._ensure_solved()
+        return self._P[5]
 
     @property
     def T5(self):
-        T5 = self.T4 - (self.T3 - self.T2)
-        return T5
+        self._ensure_solved()
+        return self._T[5]
 
     @property
     def W5(self):
-        return self.W4
+        self._ensure_solved()
+        return self._W[5]
 
     @property
     def P8(self):
-        return self.P5
+        self._ensure_solved()
+        return self._P[8]
 
     @property
     def T8(self):
-        return self.T5
+        self._ensure_solved()
+        return self._T[8]
 
     @property
     def Ps8(self):
-        return self.ambient_pressure
+        self._ensure_solved()
+        return self._Ps8
 
     @property
     def M8(self):
-        if self.mode == "design":
-            M8 = np.sqrt(
-                (np.power(self.P8 / self.Ps8, (air.gamma - 1) / air.gamma) - 1) * (2 / (air.gamma - 1)))
-            return M8
-        elif self.mode == "operation":
-            # Use this property because all the computations need to be performed in design mode
-            return self._get_design_variable("M8")
+        self._ensure_solved()
+        return self._M8
 
     @property
     def Ts8(self):
-        Ts8 = self.T8 * np.power(1 + (air.gamma - 1) / 2 *
-                                 np.power(self.M8, 2), -1)
-        return Ts8
+        self._ensure_solved()
+        return self._Ts8
 
     @property
     def W8(self):
-        return self.W5
+        self._ensure_solved()
+        return self._W[8]
 
     @property
     def W8R(self):
-        W8R = self.W8 * np.sqrt(self.T8 / REFERENCE_TEMPERATURE) / \
-            (self.P8 / REFERENCE_PRESSURE)
-        return W8R
+        self._ensure_solved()
+        return self._W8R
 
     @property
     def A8_star(self):
-        if self.mode == "design":
-            A8_star = self.W8R / self.max_reference_surface_mass_flow_rate_4_star
-            return A8_star
-        elif self.mode == "operation":
-            # Use this property because all the computations need to be performed in design mode
-            return self._get_design_variable("A8_star")
+        self._ensure_solved()
+        return self._A8_star
 
     @property
     def A8(self):
-        if self.mode == "design":
-            A8 = self.A8_star * (1 / self.M8) * np.power((2 / (air.gamma + 1)) * (
-                1 + (air.gamma - 1) / 2 * np.power(self.M8, 2)), (air.gamma + 1) / (2 * (air.gamma - 1)))
-            return A8
-        elif self.mode == "operation":
-            # Use this property because all the computations need to be performed in design mode
-            return self._get_design_variable("A8")
+        self._ensure_solved()
+        return self._A8
 
     @property
     def V8(self):
-        air.temperature = self.Ts8
-        v8 = self.M8 * air.sound_velocity
-        return v8
+        self._ensure_solved()
+        return self._V8
 
     @property
     def thrust(self):
@@ -359,24 +505,43 @@ class TurbojetSingleBody(_Turbojet):
     @property
     def propulsive_efficiency(self):
         propulsive_efficiency = self.thrust * self.V0 / \
-            (self.W0 * (np.square(self.V8) - np.square(self.V0)) / 2)
+            (self.W0 * (self.V8 * self.V8 - self.V0 * self.V0) / 2)
         return propulsive_efficiency
 
     @property
     def thermal_efficiency(self):
-        thermal_efficiency = (self.W0 * (np.square(self.V8) - np.square(self.V0)) / 2) /\
+        thermal_efficiency = (self.W0 * (self.V8 * self.V8 - self.V0 * self.V0) / 2) /\
             (self.Wf * self.fuel.lower_heating_value)
         return thermal_efficiency
 
+    def _get_stations_values(self, code: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the values of a variable at the stations of the turbojet where it is defined, from the stations cache.
+
+        Parameters
+        ----------
+        code : str
+            Code of the variable.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Ids of the stations and values of the variable.
+        """
+
+        self._ensure_solved()
+        stations_array = getattr(self, f"_{code}")[1:9]
+        id_array = np.flatnonzero(~np.isnan(stations_array)) + 1
+
+        return id_array, stations_array[id_array - 1]
+
     def _check_temperatures_positivity(self):
+        self._ensure_solved()
         for i in range(1, 9):
-            current_code = f"T{i}"
-            if current_code not in self.__dir__():
-                continue
-            current_value = self.__getattribute__(current_code)
+            current_value = self._T[i]
             if current_value < 0:
                 raise ValueError(
-                    f"{current_code} is negative ({current_value}), the domain is outside its domain of validity.")
+                    f"T{i} is negative ({current_value}), the domain is outside its domain of validity.")
 
     def _get_design_variable(self, variable: str) -> float:
         # Raise error if already in design mode
@@ -410,18 +575,20 @@ class TurbojetSingleBody(_Turbojet):
             Minimal value for A4*, by default 1e-4
         max_A4_star : float, optional
             Maximum value for A4*, by default 5e-1
-        """
 
-        # Define a cost function
-        def cost_function(A4_star):
-            self.A4_star = A4_star
-            return np.abs(desired_thrust - self.thrust)
+        Note
+        ----
+        The mass flow is proportional to A4* while the ejection velocity does not depend on it,
+        so the thrust is proportional to A4* and the solution is computed directly from a reference thrust.
+        """
 
-        # Solve by brute force
-        res = brute(cost_function, [(min_A4_star, max_A4_star)])
+        # Compute the thrust for a reference value of A4*
+        self.A4_star = max_A4_star
+        reference_thrust = self.thrust
 
         # Update A4*
-        self.A4_star = res[0]
+        self.A4_star = float(np.clip(
+            max_A4_star * desired_thrust / reference_thrust, min_A4_star, max_A4_star))
 
     def tune_current_OPR(self):
         """
@@ -440,10 +607,10 @@ class TurbojetSingleBody(_Turbojet):
 
         # Define a cost function
         def cost_function(current_OPR):
-            self.current_OPR = current_OPR
-            cost = np.abs((self.W8R / self.A8_star) -
-                          (self.W4R / self.A4_star))
-            return cost
+            self.current_OPR = float(current_OPR[0])
+            difference = (self.W8R / self.A8_star) - \
+                (self.W4R / self.A4_star)
+            return difference * difference
 
         # Solve by brute force
         res = brute(cost_function, [(0, self.OPR_design)])
@@ -9,25 +9,31 @@ Module to analyse wing aerodynamic properties.
 # Python imports #
 
 import os
+import warnings
+from functools import wraps
 from typing import Literal
-from copy import deepcopy
 
 # Dependencies #
 
 import numpy as np
 from scipy.interpolate import make_interp_spline
+from scipy.linalg import lu_factor, lu_solve
+
+# Optional dependencies #
 
 try:
     import pyvista as pv
-except Exception as exc:
-    raise Warning(
-        "Pyvista is not detected, please install it before using the 3D visualization functions.") from exc
+    PYVISTA_AVAILABLE = True
+except ImportError:
+    PYVISTA_AVAILABLE = False
+    warnings.warn(
+        "Pyvista is not detected, please install it before using the 3D visualization functions.")
 
 # Local imports #
 
-from flight_mech._common import plot_graph
+from flight_mech._common import plot_graph, lazy, njit, prange, NUMBA_AVAILABLE, LAZY_MEMORY_LIMIT
 from flight_mech.aerodynamics import compute_linear_drag
-from flight_mech.airfoil import Airfoil
+from flight_mech.airfoil import Airfoil, rotate_arrays
 
 #############
 # Constants #
@@ -37,6 +43,9 @@ from flight_mech.airfoil import Airfoil
 default_wing_database = os.path.join(
     os.path.dirname(__file__), "wing_database")
 
+# Number of fourrier points from which the fourrier matrix is built with the compiled kernel when numba is installed
+FOURRIER_KERNEL_MIN_POINTS = 100
+
 #############
 # Functions #
 #############
@@ -51,11 +60,36 @@ def check_pyvista_import():
         Raise error if pyvista cannot be accessed.
     """
 
-    try:
-        pv.__version__
-    except Exception as exc:
+    if not PYVISTA_AVAILABLE:
         raise ImportError(
-            "You need to install pyvista before using 3D visualization functions. You can do it with: 'pip install pyvista'") from exc
+            "You need to install pyvista before using 3D visualization functions. You can do it with: 'pip install pyvista'")
+
+def geometry_cached_property(func):
+    """
+    Decorator to define a wing property cached until the content of the y, chord length or twisting angle arrays
+    changes, including with in-place edits.
+
+    Parameters
+    ----------
+    func : Callable
+        Function computing the value of the property.
+
+    Returns
+    -------
+    property
+        Cached property.
+    """
+
+    name = func.__name__
+
+    @wraps(func)
+    def inner(self):
+        geometry_cache = self._get_geometry_cache()
+        if name not in geometry_cache:
+            geometry_cache[name] = func(self)
+        return geometry_cache[name]
+
+    return property(inner)
 
 def convert_y_to_theta(y_array: np.ndarray, wing_span: float):
     """
@@ -99,6 +133,66 @@ def convert_theta_to_y(theta_array: np.ndarray, wing_span: float):
 
     return y_array
 
+@lazy
+def _get_fourrier_tables(nb_points_fourrier: int):
+    """
+    Get the theta positions of the fourrier decomposition and the trigonometric tables that only depend
+    on the number of points. The arrays are cached and shared between all the wings, they are read-only.
+
+    Parameters
+    ----------
+    nb_points_fourrier : int
+        Number of points for the fourrier decomposition.
+
+    Returns
+    -------
+    tuple[np.ndarray,np.ndarray,np.ndarray,np.ndarray]
+        Tuple containing the theta positions, their sinus, the ids of the odd fourrier coefficients
+        and the table of sin(n * theta) with one row per theta position and one column per id.
+    """
+
+    theta_array = np.linspace(
+        np.pi / 2 / nb_points_fourrier, np.pi / 2, nb_points_fourrier)
+    sin_theta_array = np.sin(theta_array)
+    n_vec_odd = 2 * np.arange(nb_points_fourrier) + 1
+    sin_table = np.sin(n_vec_odd[None, :] * theta_array[:, None])
+    for array in (theta_array, sin_theta_array, n_vec_odd, sin_table):
+        array.flags.writeable = False
+
+    return theta_array, sin_theta_array, n_vec_odd, sin_table
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _build_fourrier_matrix(sin_theta_array: np.ndarray, n_vec_odd: np.ndarray, mu_array: np.ndarray, sin_table: np.ndarray):
+    """
+    Fill the matrix of the fourrier system row by row, without temporary arrays.
+
+    Parameters
+    ----------
+    sin_theta_array : np.ndarray
+        Sinus of the theta positions, one per row.
+    n_vec_odd : np.ndarray
+        Ids of the odd fourrier coefficients, one per column.
+    mu_array : np.ndarray
+        Mu coefficients on the theta positions.
+    sin_table : np.ndarray
+        Table of sin(n * theta).
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of the fourrier system.
+    """
+
+    nb_points_fourrier = sin_theta_array.shape[0]
+    mat_A = np.empty((nb_points_fourrier, nb_points_fourrier))
+    for i in prange(nb_points_fourrier):
+        sin_theta = sin_theta_array[i]
+        mu = mu_array[i]
+        for j in range(nb_points_fourrier):
+            mat_A[i, j] = (sin_theta + n_vec_odd[j] * mu) * sin_table[i, j]
+
+    return mat_A
+
 def compute_chord_min_and_max_for_trapezoidal_wing(reference_surface: float, aspect_ratio: float, taper_ratio: float):
     """
     Compute the chord min and max values for a trapezoidal wing.
@@ -135,10 +229,15 @@ class Wing:
 
     name: str | None = None
     _y_array: np.ndarray | None = None
-    chord_length_array: np.ndarray | None = None
-    twisting_angle_array: np.ndarray | None = None
+    _chord_length_array: np.ndarray | None = None
+    _twisting_angle_array: np.ndarray | None = None
     x_center_offset_array: np.ndarray | None = None
     base_airfoil: Airfoil | None = None
+    _geometry_cache: dict | None = None
+    _geometry_key: tuple | None = None
+    _surface_cache: dict | None = None
+    # Dtype of the points of the 3D surface, which can be lowered to np.float32 for visualization only
+    mesh_dtype: type = np.float64
 
     @property
     def y_array(self) -> np.ndarray:
@@ -147,6 +246,28 @@ class Wing:
         """
         return self._y_array
 
+    @property
+    def chord_length_array(self) -> np.ndarray:
+        """
+        Array of chord lengths at the y coordinates.
+        """
+        return self._chord_length_array
+
+    @chord_length_array.setter
+    def chord_length_array(self, value: np.ndarray):
+        self._chord_length_array = value
+
+    @property
+    def twisting_angle_array(self) -> np.ndarray:
+        """
+        Array of twisting angles at the y coordinates.
+        """
+        return self._twisting_angle_array
+
+    @twisting_angle_array.setter
+    def twisting_angle_array(self, value: np.ndarray):
+        self._twisting_angle_array = value
+
     @property
     def leading_edge_x_array(self) -> np.ndarray:
         """
@@ -184,15 +305,48 @@ class Wing:
             self._y_array = value
         self._chord_length = np.max(value)
 
-    @property
+    def _get_geometry_cache(self) -> dict:
+        """
+        Get the cache of the values depending on the geometry of the wing. It is cleared when the content of the y,
+        chord length or twisting angle arrays changes, the arrays being compared by their bytes.
+
+        Returns
+        -------
+        dict
+            Cache of the values depending on the geometry.
+        """
+
+        geometry_key = tuple(None if array is None else array.tobytes() for array in (
+            self.y_array, self.chord_length_array, self.twisting_angle_array))
+        if self._geometry_cache is None or geometry_key != self._geometry_key:
+            self._geometry_cache = {}
+            self._geometry_key = geometry_key
+
+        return self._geometry_cache
+
+    @geometry_cached_property
+    def _trapz_weights(self) -> np.ndarray:
+        """
+        Weights of the trapezoidal rule on the y array, such that the integral of an array over y is its dot product
+        with the weights.
+        """
+        y_array = self.y_array
+        weights = np.zeros(y_array.shape)
+        if y_array.size > 1:
+            weights[1:-1] = (y_array[2:] - y_array[:-2]) * 0.5
+            weights[0] = (y_array[1] - y_array[0]) * 0.5
+            weights[-1] = (y_array[-1] - y_array[-2]) * 0.5
+        return weights
+
+    @geometry_cached_property
     def single_side_surface(self):
         """
         Surface of a single wing.
         """
-        surface = np.trapezoid(self.chord_length_array, self.y_array)
+        surface = self.chord_length_array @ self._trapz_weights
         return surface
 
-    @property
+    @geometry_cached_property
     def reference_surface(self):
         """
         Reference surface of the wings of the plane. Equal to 2 times the surface of a single wing.
@@ -200,7 +354,7 @@ class Wing:
         reference_surface = self.single_side_surface * 2
         return reference_surface
 
-    @property
+    @geometry_cached_property
     def wing_span(self):
         """
         Wing span.
@@ -208,7 +362,7 @@ class Wing:
         wing_span = np.max(self.y_array) * 2
         return wing_span
 
-    @property
+    @geometry_cached_property
     def aspect_ratio(self):
         """
         Aspect ratio. It corresponds to the squared wing span over the reference surface.
@@ -234,7 +388,7 @@ class Wing:
             (self.trailing_edge_x_array[0] - self.trailing_edge_x_array[1]) / (self.y_array[1] - self.y_array[0]))
         return sweep_angle
 
-    @property
+    @geometry_cached_property
     def taper_ratio(self):
         """
         Taper ratio. It corresponds to the ratio of the min chord and the max chord.
@@ -296,18 +450,15 @@ class Wing:
             Indicate wether to update the y array, by default True
         """
 
-        # Create interpolation functions
-        chord_length_function = make_interp_spline(
-            self.y_array, self.chord_length_array)
-        twisting_angle_function = make_interp_spline(
-            self.y_array, self.twisting_angle_array)
-        x_center_offset_function = make_interp_spline(
-            self.y_array, self.x_center_offset_array)
+        # Create a single interpolation function for the stacked arrays
+        wing_arrays_function = make_interp_spline(
+            self.y_array, np.stack((self.chord_length_array, self.twisting_angle_array, self.x_center_offset_array), axis=1))
 
         # Interpolate on new points
-        self.chord_length_array = chord_length_function(new_y_array)
-        self.twisting_angle_array = twisting_angle_function(new_y_array)
-        self.x_center_offset_array = x_center_offset_function(new_y_array)
+        new_wing_arrays = wing_arrays_function(new_y_array)
+        self.chord_length_array = new_wing_arrays[:, 0].copy()
+        self.twisting_angle_array = new_wing_arrays[:, 1].copy()
+        self.x_center_offset_array = new_wing_arrays[:, 2].copy()
 
         # Update y array if needed
         if update_y_array:
@@ -327,11 +478,21 @@ class Wing:
             Indicate wether to clear or not the plot before, by default False
         """
 
+        # Compute the leading edge once and deduce the trailing edge from it
+        leading_edge_x_array = self.x_center_offset_array + \
+            (self.chord_length_array[0] - self.chord_length_array) * 0.5
+        trailing_edge_x_array = leading_edge_x_array + self.chord_length_array
+
         # Group to create a contour
-        x_contour_array = np.concatenate(
-            (self.leading_edge_x_array, self.trailing_edge_x_array[::-1], [self.leading_edge_x_array[0]]), axis=0)
-        y_contour_array = np.concatenate(
-            (self.y_array, self.y_array[::-1], [self.y_array[0]]), axis=0)
+        nb_stations = self.y_array.size
+        x_contour_array = np.empty(2 * nb_stations + 1)
+        x_contour_array[:nb_stations] = leading_edge_x_array
+        x_contour_array[nb_stations:2 * nb_stations] = trailing_edge_x_array[::-1]
+        x_contour_array[-1] = x_contour_array[0]
+        y_contour_array = np.empty(2 * nb_stations + 1)
+        y_contour_array[:nb_stations] = self.y_array
+        y_contour_array[nb_stations:2 * nb_stations] = self.y_array[::-1]
+        y_contour_array[-1] = y_contour_array[0]
 
         # Plot the graph
         plot_graph(
@@ -348,6 +509,71 @@ class Wing:
             axis_type="equal"
         )
 
+    def _prepare_3D_animation(self, nb_points_airfoil: int, nb_frames: int, **kwargs):
+        """
+        Prepare the off-screen pyvista scene and the orbital camera path of a 3D animation.
+
+        Parameters
+        ----------
+        nb_points_airfoil : int
+            Number of points to use for the airfoil.
+        nb_frames : int
+            Number of frames in the animation.
+        kwargs : dict
+            Parameters to pass to the plot 3D function.
+
+        Returns
+        -------
+        tuple[pv.Plotter,pv.PolyData]
+            Plotter containing the wing and orbital path of the camera.
+        """
+
+        # Prepare the pyvista scene
+        pl, wing_surface = self.plot_3D(
+            nb_points_airfoil=nb_points_airfoil, for_animation=True, **kwargs)
+        pl.show(auto_close=False)
+
+        # Create the camera path around the wing
+        path = pl.generate_orbital_path(
+            n_points=nb_frames, shift=wing_surface.length, factor=3.0)
+
+        return pl, path
+
+    def iter_3D_frames(self, nb_points_airfoil: int = 50, nb_frames: int = 60, **kwargs):
+        """
+        Generate the frames of the rotating 3D animation of the wing in memory, without encoding them.
+
+        Parameters
+        ----------
+        nb_points_airfoil : int, optional
+            Number of points to use for the airfoil, by default 50
+        nb_frames : int, optional
+            Number of frames in the animation, by default 60
+        kwargs : dict
+            Parameters to pass to the plot 3D function.
+
+        Yields
+        ------
+        np.ndarray
+            Image of the frame, with shape (height, width, nb_channels).
+        """
+
+        # Prepare the pyvista scene
+        pl, path = self._prepare_3D_animation(
+            nb_points_airfoil, nb_frames, **kwargs)
+        focus = pl.center
+
+        # Render the frames along the camera path
+        try:
+            for point in path.points:
+                pl.set_position(point, render=False)
+                pl.set_focus(focus, render=False)
+                pl.renderer.ResetCameraClippingRange()
+                pl.render()
+                yield pl.image
+        finally:
+            pl.close()
+
     def create_3D_animation(self, output_path: str, nb_points_airfoil: int = 50, nb_frames: int = 60, time_step: float = 0.05, **kwargs):
         """
         Create a rotating 3D animation of the wing.
@@ -366,20 +592,11 @@ class Wing:
             Parameters to pass to the plot 3D function.
         """
 
-        # Create the wing surface
-        # wing_surface = self.create_wing_3D_surface(nb_points_airfoil)
-
-        # pl = pv.Plotter(off_screen=True)
-        # pl.add_mesh(wing_surface)
-
         # Prepare the pyvista scene
-        pl, wing_surface = self.plot_3D(
-            nb_points_airfoil=nb_points_airfoil, for_animation=True, **kwargs)
+        pl, path = self._prepare_3D_animation(
+            nb_points_airfoil, nb_frames, **kwargs)
 
         # Animate
-        pl.show(auto_close=False)
-        path = pl.generate_orbital_path(
-            n_points=nb_frames, shift=wing_surface.length, factor=3.0)
         if not output_path.endswith(".gif"):
             output_path = output_path + ".gif"
         pl.open_gif(output_path)
@@ -398,38 +615,87 @@ class Wing:
 
         Returns
         -------
-        pv.PointSet
-            Pyvista 3D surface.
+        pv.PolyData
+            Pyvista 3D surface, with the points ordered by span station and of dtype mesh_dtype.
+
+        Note
+        ----
+        The surface is cached with a key built from the geometry of the wing and of its airfoil,
+        a copy of the cached surface is returned.
         """
 
         # Check if pyvista is imported
         check_pyvista_import()
 
-        # Create a display airfoil with normalized chord and less points
-        display_airfoil = deepcopy(self.base_airfoil)
-        display_airfoil.chord_length = 1
-        display_airfoil.re_interpolate_with_cosine_distribution(
+        # Return a copy of the cached surface if the geometry has not changed
+        surface_key = (
+            nb_points_airfoil,
+            np.dtype(self.mesh_dtype).str,
+            self.y_array.tobytes(),
+            self.chord_length_array.tobytes(),
+            self.twisting_angle_array.tobytes(),
+            self.x_center_offset_array.tobytes(),
+            self.base_airfoil.x_array.tobytes(),
+            self.base_airfoil.extrados_z_array.tobytes(),
+            self.base_airfoil.intrados_z_array.tobytes()
+        )
+        if self._surface_cache is None:
+            self._surface_cache = {}
+        if surface_key in self._surface_cache:
+            return self._surface_cache[surface_key].copy()
+
+        # Get the airfoil with normalized chord and less points
+        x_selig_array, z_selig_array = self.base_airfoil.get_normalized_cosine_selig_arrays(
             nb_points_airfoil // 2)
 
+        # Rotate the airfoil for all the span stations at once, with shape (nb_stations, nb_points_airfoil)
+        ratio_array = self.chord_length_array[:, None]
+        airfoil_x_array, airfoil_z_array = rotate_arrays(
+            x_selig_array, z_selig_array, self.twisting_angle_array[:, None], x_length=1)
+
         # Create an array containing all the points
-        points_array = np.zeros((nb_points_airfoil * self.y_array.size, 3))
-        for i in range(self.y_array.size):
-            ratio = self.chord_length_array[i] / display_airfoil.chord_length
-            airfoil_x_array, airfoil_z_array = display_airfoil.get_rotated_selig_arrays(
-                self.twisting_angle_array[i])
-            points_index = i * nb_points_airfoil
-            points_array[points_index:points_index + nb_points_airfoil, 0] =\
-                airfoil_x_array[:-1] * ratio + \
-                self.x_center_offset_array[i] + (
-                    self.chord_length_array[0] - self.chord_length_array[i]) / 2
-            points_array[points_index:points_index +
-                         nb_points_airfoil, 1] = self.y_array[i]
-            points_array[points_index:points_index + nb_points_airfoil,
-                         2] = airfoil_z_array[:-1] * ratio
-
-        # Create a mesh from the points
-        point_cloud = pv.PolyData(points_array)
-        wing_surface = point_cloud.delaunay_3d()
+        points_array = np.empty(
+            (self.y_array.size, nb_points_airfoil, 3), dtype=self.mesh_dtype)
+        points_array[:, :, 0] = airfoil_x_array[:, :-1] * ratio_array + \
+            self.x_center_offset_array[:, None] + \
+            (self.chord_length_array[0] - self.chord_length_array[:, None]) / 2
+        points_array[:, :, 1] = self.y_array[:, None]
+        points_array[:, :, 2] = airfoil_z_array[:, :-1] * ratio_array
+        points_array = points_array.reshape(-1, 3)
+
+        # Connect each airfoil point to the next one and to the same points of the next station with quads
+        nb_stations = self.y_array.size
+        point_ids = np.arange(nb_stations * nb_points_airfoil).reshape(
+            nb_stations, nb_points_airfoil)
+        next_point_ids = np.roll(point_ids, -1, axis=1)
+        side_quads_array = np.empty(
+            (nb_stations - 1, nb_points_airfoil, 5), dtype=np.int64)
+        side_quads_array[:, :, 0] = 4
+        side_quads_array[:, :, 1] = point_ids[:-1]
+        side_quads_array[:, :, 2] = next_point_ids[:-1]
+        side_quads_array[:, :, 3] = next_point_ids[1:]
+        side_quads_array[:, :, 4] = point_ids[1:]
+
+        # Close the root and the tip with quads between the extrados and intrados points of same x
+        nb_points_face = nb_points_airfoil // 2
+        extrados_ids = np.arange(nb_points_face)
+        intrados_ids = nb_points_airfoil - 1 - extrados_ids
+        cap_quads_array = np.empty((2, nb_points_face - 1, 5), dtype=np.int64)
+        cap_quads_array[:, :, 0] = 4
+        cap_quads_array[0, :, 1:] = np.stack(
+            (extrados_ids[:-1], intrados_ids[:-1], intrados_ids[1:], extrados_ids[1:]), axis=1)
+        cap_quads_array[1, :, 1:] = (nb_stations - 1) * nb_points_airfoil + np.stack(
+            (extrados_ids[:-1], extrados_ids[1:], intrados_ids[1:], intrados_ids[:-1]), axis=1)
+        faces_array = np.concatenate(
+            (side_quads_array.ravel(), cap_quads_array.ravel()))
+
+        # Create a mesh from the points and the faces
+        wing_surface = pv.PolyData(points_array, faces_array)
+
+        # Store it in the cache
+        if len(self._surface_cache) > LAZY_MEMORY_LIMIT:
+            self._surface_cache.clear()
+        self._surface_cache[surface_key] = wing_surface.copy()
 
         return wing_surface
 
@@ -476,14 +742,22 @@ class Wing:
                 raise ValueError(
                     f"The values of velocity or rho or nu are not properly defined. Please provide them all to show the drag on the wing.")
 
-            # Allocate an array for the drag
-            drag_array = np.zeros(nb_points_airfoil * self.y_array.size)
-            for i in range(self.y_array.size):
-                points_index = i * nb_points_airfoil
-                drag_array[points_index:points_index + nb_points_airfoil // 2] = self.compute_zero_lift_drag_on_wing_slice(
-                    i, velocity, rho, nu, show_drag, velocity_method, nb_points_airfoil // 2, return_array=True, face="upper")[1]
-                drag_array[points_index + nb_points_airfoil // 2:points_index + nb_points_airfoil] = self.compute_zero_lift_drag_on_wing_slice(
-                    i, velocity, rho, nu, show_drag, velocity_method, nb_points_airfoil // 2, return_array=True, face="lower")[1][::-1]
+            # Allocate an array for the drag, with one row per slice
+            nb_points_face = nb_points_airfoil // 2
+            drag_array = np.zeros((self.y_array.size, nb_points_airfoil))
+            if show_drag == "blasius":
+                # Compute the wall shear stress of all slices at once
+                drag_array[:, :nb_points_face] = self.compute_zero_lift_drag_on_wing_slice(
+                    slice(None), velocity, rho, nu, show_drag, velocity_method, nb_points_face, return_array=True, face="upper")[1]
+                drag_array[:, nb_points_face:2 * nb_points_face] = self.compute_zero_lift_drag_on_wing_slice(
+                    slice(None), velocity, rho, nu, show_drag, velocity_method, nb_points_face, return_array=True, face="lower")[1][:, ::-1]
+            else:
+                for i in range(self.y_array.size):
+                    drag_array[i, :nb_points_face] = self.compute_zero_lift_drag_on_wing_slice(
+                        i, velocity, rho, nu, show_drag, velocity_method, nb_points_face, return_array=True, face="upper")[1]
+                    drag_array[i, nb_points_face:2 * nb_points_face] = self.compute_zero_lift_drag_on_wing_slice(
+                        i, velocity, rho, nu, show_drag, velocity_method, nb_points_face, return_array=True, face="lower")[1][::-1]
+            drag_array = drag_array.ravel()
 
             scalars = drag_array
             max_drag = np.max(drag_array[drag_array != np.inf])
@@ -517,6 +791,7 @@ class Wing:
     def save_3D_shape(self, output_path: str, nb_points_airfoil: int = 50):
         """
         Save the wing shape as a 3D object. The format can be '.ply', '.vtp', '.stl', '.vtk', '.geo', '.obj' or '.iv'.
+        The formats supporting it are written in binary.
 
         Parameters
         ----------
@@ -529,8 +804,61 @@ class Wing:
         # Create the 3D surface
         wing_surface = self.create_wing_3D_surface(nb_points_airfoil)
 
-        # Save the output file
-        wing_surface.extract_geometry().save(output_path)
+        # Save the output file, the surface being already a polydata copy (the stl files are written in binary)
+        wing_surface.save(output_path, binary=True)
+
+    def _get_fourrier_system(self, nb_points_fourrier: int):
+        """
+        Get the factorized matrix and the geometric terms of the fourrier system.
+        They only depend on the geometry of the wing and are cached until the content of the y, chord length or
+        twisting angle arrays changes.
+
+        Parameters
+        ----------
+        nb_points_fourrier : int
+            Number of points for the fourrier decomposition.
+
+        Returns
+        -------
+        tuple
+            Tuple containing the LU factorization of the matrix, the sinus of theta, the mu coefficients,
+            the twisting angles on the theta positions and the fourrier coefficients ids.
+        """
+
+        # Return the cached system if possible
+        geometry_cache = self._get_geometry_cache()
+        fourrier_key = ("fourrier_system", nb_points_fourrier)
+        if fourrier_key in geometry_cache:
+            return geometry_cache[fourrier_key]
+
+        # Change variable from y to theta
+        theta_array = convert_y_to_theta(self.y_array[::-1], self.wing_span)
+
+        # Create a single function to interpolate the chord length and twisting angle arrays on new positions
+        geometry_on_theta_func = make_interp_spline(
+            theta_array, np.stack((self.chord_length_array[::-1], self.twisting_angle_array[::-1]), axis=1))
+
+        # Get the theta positions to interpolate and the trigonometric tables
+        theta_interpolation_pos, sin_theta, n_vec_odd, sin_table = _get_fourrier_tables(
+            nb_points_fourrier)
+        chord_length_on_theta, twisting_angle_on_theta = geometry_on_theta_func(
+            theta_interpolation_pos).T
+
+        # Fill the system to solve, with one row per theta position and one column per odd fourrier mode
+        mu_array = (2 * np.pi * chord_length_on_theta) / (4 * self.wing_span)
+        if NUMBA_AVAILABLE and nb_points_fourrier >= FOURRIER_KERNEL_MIN_POINTS:
+            mat_A = _build_fourrier_matrix(
+                sin_theta, n_vec_odd, mu_array, sin_table)
+        else:
+            mat_A = (sin_theta[:, None] + n_vec_odd[None, :]
+                     * mu_array[:, None]) * sin_table
+
+        # Factorize the matrix in place and store the system, the matrix being checked once for non-finite values
+        fourrier_system = (lu_factor(mat_A, overwrite_a=True), sin_theta, mu_array,
+                           twisting_angle_on_theta, n_vec_odd)
+        geometry_cache[fourrier_key] = fourrier_system
+
+        return fourrier_system
 
     def compute_fourrier_coefficients(self, alpha: float, nb_points_fourrier: int = 10):
         """
@@ -549,49 +877,45 @@ class Wing:
             Tuple containing the fourrier coefficients and their ids.
         """
 
-        # Change variable from y to theta
-        theta_array = convert_y_to_theta(self.y_array[::-1], self.wing_span)
+        An_mat_odd, n_vec_odd = self.compute_fourrier_coefficients_batch(
+            np.array([alpha]), nb_points_fourrier)
 
-        # Create functions to be able to interpolate the arrays on new positions
-        chord_length_on_theta_func = make_interp_spline(
-            theta_array, self.chord_length_array[::-1])
-        twisting_angle_on_theta_func = make_interp_spline(
-            theta_array, self.twisting_angle_array[::-1])
+        return An_mat_odd[:, 0], n_vec_odd
 
-        # Create theta positions to interpolate
-        theta_interpolation_pos = np.linspace(
-            np.pi / 2 / nb_points_fourrier, np.pi / 2, nb_points_fourrier)
-        chord_length_on_theta = chord_length_on_theta_func(
-            theta_interpolation_pos)
-        twisting_angle_on_theta = twisting_angle_on_theta_func(
-            theta_interpolation_pos)
+    def compute_fourrier_coefficients_batch(self, alpha_array: np.ndarray, nb_points_fourrier: int = 10):
+        """
+        Compute the fourrier coefficients for several angles of incidence at once. The system is solved
+        for all the angles with a single call, the matrix only depending on the geometry.
 
-        # Compute the alpha at zero lift for the airfoil
-        alpha_zero_lift = self.base_airfoil.compute_alpha_zero_lift()
+        Parameters
+        ----------
+        alpha_array : np.ndarray
+            Angles of incidence of the wing.
+        nb_points_fourrier : int, optional
+            Number of points for the fourrier decomposition, by default 10
 
-        # Allocate variables to define the system to solve
-        mat_A = np.zeros((nb_points_fourrier, nb_points_fourrier))
-        vec_B = np.zeros(nb_points_fourrier)
+        Returns
+        -------
+        tuple[np.ndarray,np.ndarray]
+            Tuple containing the fourrier coefficients, with one column per angle of incidence, and their ids.
+        """
 
-        # Iterate to fill the system
-        for i in range(nb_points_fourrier):
-            mu_loc = (
-                2 * np.pi * chord_length_on_theta[i]) / (4 * self.wing_span)
-            for j in range(nb_points_fourrier):
-                n = 2 * j + 1
-                mat_A[i, j] = (np.sin(theta_interpolation_pos[i]) +
-                               n * mu_loc) * np.sin(n * theta_interpolation_pos[i])
+        # Get the matrix of the system, which only depends on the geometry
+        lu_and_piv, sin_theta, mu_array, twisting_angle_on_theta, n_vec_odd = self._get_fourrier_system(
+            nb_points_fourrier)
 
-            vec_B[i] = np.sin(theta_interpolation_pos[i]) * \
-                (-twisting_angle_on_theta[i] +
-                 alpha - alpha_zero_lift) * mu_loc
+        # Compute the alpha at zero lift for the airfoil
+        alpha_zero_lift = self.base_airfoil.compute_alpha_zero_lift()
 
-        # Solve the system
-        An_vec_odd = np.linalg.solve(mat_A, vec_B)
-        n_vec_odd = np.linspace(
-            1, nb_points_fourrier * 2 - 1, nb_points_fourrier)
+        # Solve the system for all the angles of incidence, with one right hand side per angle
+        mat_B = sin_theta[:, None] * \
+            (-twisting_angle_on_theta[:, None] + np.asarray(alpha_array)[None, :] - alpha_zero_lift) * \
+            mu_array[:, None]
+        An_mat_odd = lu_solve(
+            lu_and_piv, mat_B, overwrite_b=True, check_finite=False)
 
-        return An_vec_odd, n_vec_odd
+        # Return a float copy of the ids, the table of ids being shared and read-only
+        return An_mat_odd, n_vec_odd.astype(float)
 
     def compute_lift_and_induced_drag_coefficients(self, alpha: float, nb_points_fourrier: int = 10):
         """
@@ -610,19 +934,41 @@ class Wing:
             Tuple containing the lift and induced drag coefficients.
         """
 
+        CL_array, CD_array = self.compute_lift_and_induced_drag_coefficients_batch(
+            np.array([alpha]), nb_points_fourrier)
+
+        return CL_array[0], CD_array[0]
+
+    def compute_lift_and_induced_drag_coefficients_batch(self, alpha_array: np.ndarray, nb_points_fourrier: int = 10):
+        """
+        Compute the coefficients of lift and induced drag for several angles of incidence at once.
+
+        Parameters
+        ----------
+        alpha_array : np.ndarray
+            Angles of incidence of the wing.
+        nb_points_fourrier : int, optional
+            Number of points for the fourrier decomposition, by default 10
+
+        Returns
+        -------
+        tuple[np.ndarray,np.ndarray]
+            Tuple containing the arrays of lift and induced drag coefficients.
+        """
+
         # Compute the fourrier coefficients
-        An_vec_odd, n_vec_odd = self.compute_fourrier_coefficients(
-            alpha, nb_points_fourrier)
+        An_mat_odd, n_vec_odd = self.compute_fourrier_coefficients_batch(
+            alpha_array, nb_points_fourrier)
 
         # Compute the lift and induced drag coefficients
-        CL = np.pi * An_vec_odd[0] * self.aspect_ratio
-        CD = np.pi * self.aspect_ratio * \
-            np.sum(n_vec_odd * np.power(An_vec_odd, 2))
+        CL_array = np.pi * An_mat_odd[0] * self.aspect_ratio
+        CD_array = np.pi * self.aspect_ratio * \
+            np.einsum("i,ik,ik->k", n_vec_odd, An_mat_odd, An_mat_odd)
 
-        return CL, CD
+        return CL_array, CD_array
 
     def compute_zero_lift_drag_on_wing_slice(self,
-                                             y_index: int,
+                                             y_index: int | slice,
                                              velocity: float,
                                              rho: float,
                                              nu: float,
@@ -638,8 +984,9 @@ class Wing:
 
         Parameters
         ----------
-        y_index : int
-            Index of the slice.
+        y_index : int | slice
+            Index of the slice. A slice of indices can be given with the 'blasius' method
+            to compute several slices at once.
         velocity : float
             Velocity of the external flow.
         rho : float
@@ -666,13 +1013,13 @@ class Wing:
             Raise error if the given method is not defined.
         """
 
-        # Create x array
+        # Create x array, with one row per slice if several slices are given
         x_array = np.linspace(
-            0, self.chord_length_array[y_index], nb_points)
+            0, self.chord_length_array[y_index], nb_points, axis=-1)
 
         # Create velocity array
         if velocity_method == "constant":
-            velocity_array = velocity * np.ones(nb_points)
+            velocity_array = velocity * np.ones(x_array.shape)
         elif velocity_method == "panels":
             raise NotImplementedError
             if face == "upper":
@@ -733,13 +1080,17 @@ class Wing:
                 self.compute_zero_lift_drag(
                     velocity, rho, nu, drag_method, velocity_method, nb_points, face="lower")
         else:
-            # Compute linear drag on the wing
-            linear_drag_on_wing = np.zeros(self.y_array.shape)
-            for i in range(self.y_array.size):
-                linear_drag_on_wing[i] = self.compute_zero_lift_drag_on_wing_slice(
-                    i, velocity, rho, nu, drag_method, velocity_method, nb_points, face=face)
+            # Compute linear drag on the wing, all slices at once for the Blasius closed form
+            if drag_method == "blasius":
+                linear_drag_on_wing = self.compute_zero_lift_drag_on_wing_slice(
+                    slice(None), velocity, rho, nu, drag_method, velocity_method, nb_points, face=face)
+            else:
+                linear_drag_on_wing = np.zeros(self.y_array.shape)
+                for i in range(self.y_array.size):
+                    linear_drag_on_wing[i] = self.compute_zero_lift_drag_on_wing_slice(
+                        i, velocity, rho, nu, drag_method, velocity_method, nb_points, face=face)
 
             # Integrate the drag over y
-            zero_lift_drag = np.trapezoid(linear_drag_on_wing, self.y_array)
+            zero_lift_drag = linear_drag_on_wing @ self._trapz_weights
 
         return zero_lift_drag
@@ -0,0 +1,27 @@
+"""
+Optional build script for the compiled kernels of flight-mech.
+
+The package itself is built with hatchling and does not require these kernels. To compile them in place, install
+Cython and run:
+
+    python setup.py build_ext --inplace
+"""
+
+import sys
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit(
+        "Cython is required to build the compiled kernels. You can install it with: 'pip install Cython'")
+
+setup(
+    packages=[],
+    ext_modules=cythonize(
+        [Extension("flight_mech._landing_kernel",
+                   ["flight_mech/_landing_kernel.pyx"])],
+        language_level=3
+    )
+)
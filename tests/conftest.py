@@ -0,0 +1,179 @@
+"""
+Module to define the pytest fixtures shared by the tests.
+"""
+
+###########
+# Imports #
+###########
+
+# Python imports #
+
+import os
+import sys
+from copy import deepcopy
+sys.path.append(".")
+
+# Also select the non-interactive backend for the subprocesses, such as the notebook kernels
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Share the cores between the pytest-xdist workers for the parallel numba kernels, before numba is imported
+if "PYTEST_XDIST_WORKER_COUNT" in os.environ:
+    os.environ.setdefault("NUMBA_NUM_THREADS", str(
+        max(1, (os.cpu_count() or 1) // int(os.environ["PYTEST_XDIST_WORKER_COUNT"]))))
+
+# Dependencies #
+
+import pytest
+import numpy as np
+import matplotlib
+# Use the non-interactive backend before pyplot is imported by the tested modules
+matplotlib.use("Agg", force=True)
+import matplotlib.pyplot as plt
+
+# Lower the resolution before saving the figures
+plt.rcParams["savefig.dpi"] = 72
+
+# Local imports #
+
+from flight_mech.airfoil import Airfoil, default_airfoil_database
+from flight_mech.plane import Plane
+from flight_mech.wing import Wing
+
+# Import test tools
+from tests._common import data_folder
+
+#########
+# Hooks #
+#########
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network", action="store_true", default=False,
+        help="Run the tests that access airfoiltools.com instead of stubbing the HTTP requests.")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Run the slow tests last when they are selected, the order being kept otherwise ('--ff' and '--lf' reorder afterwards)
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
+
+###########
+# Classes #
+###########
+
+class _StubResponse:
+    """
+    Minimal replacement of a requests response.
+    """
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.text = content.decode()
+
+    def raise_for_status(self):
+        pass
+
+############
+# Fixtures #
+############
+
+@pytest.fixture(scope="session")
+def naca4412_predictions():
+    """
+    Predictions of airfoiltools for the naca4412 airfoil, loaded once per session. The 'alpha', 'cl' and 'cm'
+    columns of the polar xf-naca4412-il-500000 are stored as binary arrays.
+    """
+    with np.load(os.path.join(data_folder, "xf-naca4412-il-500000.npz")) as predictions:
+        return dict(predictions)
+
+@pytest.fixture(scope="session")
+def naca4412_linear_range_predictions(naca4412_predictions):
+    """
+    Predictions of airfoiltools for the naca4412 airfoil restricted to the incidences below 7.5 degrees,
+    where the thin airfoil theory applies. The 'alpha' array is converted to radians.
+    """
+    mask = np.abs(naca4412_predictions["alpha"]) <= 7.5
+    return {
+        "alpha": np.ascontiguousarray(naca4412_predictions["alpha"][mask] * (np.pi / 180), dtype=np.float64),
+        "cl": naca4412_predictions["cl"][mask],
+        "cm": naca4412_predictions["cm"][mask]
+    }
+
+@pytest.fixture(scope="session")
+def naca4412_airfoil():
+    """
+    Naca4412 airfoil built once per session. It must not be modified by the tests.
+    """
+    return Airfoil("naca4412")
+
+@pytest.fixture
+def naca4412_airfoil_copy(naca4412_airfoil):
+    """
+    Copy of the naca4412 airfoil for the tests that modify it.
+    """
+    return deepcopy(naca4412_airfoil)
+
+@pytest.fixture(scope="session")
+def _su27_template():
+    """
+    Su-27 plane loaded once per session. It must not be modified by the tests.
+    """
+    return Plane("su_27")
+
+@pytest.fixture
+def su27(_su27_template):
+    """
+    Copy of the Su-27 plane for a test, which can modify it.
+    """
+    return deepcopy(_su27_template)
+
+@pytest.fixture(autouse=True)
+def _reuse_figure():
+    """
+    Reuse the current matplotlib figure across the tests and clear it after each test.
+    """
+    figure = plt.gcf()
+    yield
+    figure.clear()
+
+@pytest.fixture(scope="session")
+def _base_wing_template(naca4412_airfoil):
+    """
+    Twisted wing of 100 sections with a naca4412 airfoil, built once per session.
+    It must not be modified by the tests.
+    """
+    wing = Wing()
+    wing.y_array = np.linspace(0, 10, 100)
+    wing.chord_length_array = np.linspace(3, 1, 100)
+    wing.twisting_angle_array = np.linspace(0, 0.1, 100)
+    wing.x_center_offset_array = np.zeros(100)
+    wing.base_airfoil = deepcopy(naca4412_airfoil)
+    wing.initialize()
+    return wing
+
+@pytest.fixture
+def base_wing(_base_wing_template):
+    """
+    Copy of the base wing for a test, which can modify it.
+    """
+    return deepcopy(_base_wing_template)
+
+@pytest.fixture
+def airfoiltools_stub(request, monkeypatch):
+    """
+    Serve the airfoiltools search page and Selig file from local files instead of the network,
+    unless the '--run-network' option is given.
+    """
+
+    if request.config.getoption("--run-network"):
+        return
+
+    def stub_get(url, params=None, **kwargs):
+        if "seligdatfile" in url:
+            file_path = os.path.join(default_airfoil_database, "n2415.txt")
+        else:
+            file_path = os.path.join(
+                data_folder, "airfoiltools_naca_16_15_re50k.html")
+        with open(file_path, "rb") as file:
+            return _StubResponse(file.read())
+
+    monkeypatch.setattr("flight_mech.airfoil.requests.get", stub_get)
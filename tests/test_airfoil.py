@@ -14,8 +14,8 @@ sys.path.append(".")
 
 # Dependencies #
 
+import pytest
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 
 # Local imports #
@@ -30,8 +30,6 @@ from tests._common import check_value, output_folder, data_folder
 # Constants #
 #############
 
-airfoil_tools_predictions_naca4412 = pd.read_csv(
-    os.path.join(data_folder, "xf-naca4412-il-500000.csv"), skiprows=10)
 coefficient_error_threshold = 0.05
 
 #########
@@ -43,15 +41,31 @@ def test_load_selig_file():
     airfoil.load_selig_file(os.path.join(
         data_folder, "fx62k153.txt"), 1)
 
-def test_import_from_airfoiltools():
+def test_load_selig_file_cache():
+    airfoil_1 = Airfoil("naca4412")
+    airfoil_2 = Airfoil("naca4412")
+    assert airfoil_1.name == airfoil_2.name
+    assert np.array_equal(airfoil_1.extrados_z_array, airfoil_2.extrados_z_array)
+
+    # Check that the airfoils do not share their arrays
+    airfoil_1.max_thickness = 0.2
+    assert not np.array_equal(airfoil_1.extrados_z_array, airfoil_2.extrados_z_array)
+    assert np.isclose(Airfoil("naca4412").max_thickness, airfoil_2.max_thickness)
+
+def test_import_from_airfoiltools(airfoiltools_stub, tmp_path):
     airfoil = Airfoil()
     airfoil.import_from_airfoiltools(
-        "NACA", max_thickness=16, min_thickness=15, maximise_glide_ratio_at_reynolds="50k")
+        "NACA", max_thickness=16, min_thickness=15, maximise_glide_ratio_at_reynolds="50k",
+        airfoil_data_folder=str(tmp_path))
+    assert airfoil.name is not None
+    assert airfoil.x_array.size > 0
 
-def test_re_interpolate():
+@pytest.mark.parametrize("airfoil_name", ["fx62k153", "naca4412", "n11h9"])
+def test_re_interpolate(airfoil_name):
     airfoil = Airfoil()
-    airfoil.load_database_airfoil("fx62k153")
-    airfoil.re_interpolate(np.linspace(0, 1, 1000))
+    airfoil.load_database_airfoil(airfoil_name)
+    airfoil.re_interpolate(np.linspace(0, 1, 256))
+    assert airfoil.x_array.size == 256
 
 def test_max_thickness():
     airfoil = Airfoil()
@@ -79,44 +93,45 @@ def test_compute_airfoil_fourrier_coefficients():
     check_value(0.2501, airfoil._a1, tolerance=0.2)
     check_value(0.2388, airfoil._a2, tolerance=0.2)
 
-def test_compute_lift_coefficient():
-    airfoil = Airfoil("naca4412")
-    alpha_deg = airfoil_tools_predictions_naca4412["Alpha"]
-    mask = np.abs(alpha_deg) <= 7.5
-    alpha = alpha_deg[mask] * np.pi / 180
-    CL_airfoil_tools = airfoil_tools_predictions_naca4412["Cl"][mask]
-    CL = airfoil.compute_lift_coefficient(alpha)
-    max_diff = np.max(np.abs(CL - CL_airfoil_tools))
+def test_compute_lift_coefficient(naca4412_airfoil, naca4412_linear_range_predictions):
+    CL = naca4412_airfoil.compute_lift_coefficient(
+        naca4412_linear_range_predictions["alpha"])
+    max_diff = np.max(np.abs(CL - naca4412_linear_range_predictions["cl"]))
     assert max_diff < coefficient_error_threshold
 
-def test_compute_momentum_coefficient():
-    airfoil = Airfoil("naca4412")
-    alpha_deg = airfoil_tools_predictions_naca4412["Alpha"]
-    mask = np.abs(alpha_deg) <= 7.5
-    alpha = alpha_deg[mask] * np.pi / 180
-    Cm_airfoil_tools = airfoil_tools_predictions_naca4412["Cm"][mask]
-    Cm = airfoil.compute_momentum_coefficient_at_aero_center(alpha)
-    max_diff = np.max(np.abs(Cm - Cm_airfoil_tools))
+def test_compute_momentum_coefficient(naca4412_airfoil, naca4412_linear_range_predictions):
+    Cm = naca4412_airfoil.compute_momentum_coefficient_at_aero_center(
+        naca4412_linear_range_predictions["alpha"])
+    max_diff = np.max(np.abs(Cm - naca4412_linear_range_predictions["cm"]))
     assert max_diff < coefficient_error_threshold
 
-def test_plot_CL_graph():
-    airfoil = Airfoil("naca4412")
-    airfoil.plot_CL_graph(save_path=os.path.join(
+def test_compute_lift_and_momentum_coefficients(naca4412_airfoil, naca4412_linear_range_predictions):
+    CL, Cm = naca4412_airfoil.compute_lift_and_momentum_coefficients(
+        naca4412_linear_range_predictions["alpha"])
+    assert np.max(np.abs(CL - naca4412_linear_range_predictions["cl"])) < coefficient_error_threshold
+    assert np.max(np.abs(Cm - naca4412_linear_range_predictions["cm"])) < coefficient_error_threshold
+
+def test_plot_CL_graph(naca4412_airfoil):
+    naca4412_airfoil.plot_CL_graph(save_path=os.path.join(
         output_folder, "CL.png"), clear_before_plot=True, hold_plot=True)
 
-def test_plot_Cm_graph():
-    airfoil = Airfoil("naca4412")
-    airfoil.plot_Cm_graph(save_path=os.path.join(
+def test_plot_Cm_graph(naca4412_airfoil):
+    naca4412_airfoil.plot_Cm_graph(save_path=os.path.join(
         output_folder, "Cm.png"), clear_before_plot=True, hold_plot=True)
 
-def test_compute_alpha_zero_lift():
-    airfoil = Airfoil("naca4412")
+def test_compute_alpha_zero_lift(naca4412_airfoil_copy):
+    airfoil = naca4412_airfoil_copy
     alpha_zero_lift_airfoil_tools = -4.35 * np.pi / 180
     alpha_zero_lift = airfoil.compute_alpha_zero_lift()
     check_value(alpha_zero_lift_airfoil_tools, alpha_zero_lift)
 
-def test_change_thickness():
-    airfoil = Airfoil("naca4412")
+    # Check that the cached value is reset when the camber changes
+    assert airfoil.compute_alpha_zero_lift() == alpha_zero_lift
+    airfoil.max_camber = 0.01
+    assert airfoil.compute_alpha_zero_lift() > alpha_zero_lift
+
+def test_change_thickness(naca4412_airfoil_copy):
+    airfoil = naca4412_airfoil_copy
     prev_max_camber = airfoil.max_camber
     prev_max_camber_location = airfoil.max_camber_location
     airfoil.max_thickness = 0.07
@@ -125,21 +140,21 @@ def test_change_thickness():
     assert np.isclose(airfoil.max_camber_location,
                       prev_max_camber_location, rtol=0.0001).all()
 
-def test_change_camber():
-    airfoil = Airfoil("naca4412")
+def test_change_camber(naca4412_airfoil_copy):
+    airfoil = naca4412_airfoil_copy
     prev_max_thickness = airfoil.max_thickness
     airfoil.max_camber = 0.01
     assert np.isclose(airfoil.max_camber, 0.01, rtol=0.0001).all()
     assert np.isclose(airfoil.max_thickness,
                       prev_max_thickness, rtol=0.0001).all()
 
-def test_naca_airfoil_generator():
-    airfoil_1 = naca_airfoil_generator(4 / 100, 4 / 10, 12 / 100)
-    assert np.isclose(airfoil_1.max_camber, 0.04, rtol=0.01)
-    assert np.isclose(airfoil_1.max_thickness, 0.12, rtol=0.01)
-    assert np.isclose(airfoil_1.max_camber_location, 0.4, rtol=0.01)
-
-    airfoil_2 = naca_airfoil_generator(naca_name="naca2412")
-    assert np.isclose(airfoil_2.max_camber, 0.02, rtol=0.01)
-    assert np.isclose(airfoil_2.max_thickness, 0.12, rtol=0.01)
-    assert np.isclose(airfoil_2.max_camber_location, 0.4, rtol=0.01)
+@pytest.mark.parametrize("generator_kwargs,expected", [
+    ({"maximum_camber": 4 / 100, "maximum_camber_position": 4 / 10, "maximum_thickness": 12 / 100}, (0.04, 0.4, 0.12)),
+    ({"naca_name": "naca2412"}, (0.02, 0.4, 0.12))
+])
+def test_naca_airfoil_generator(generator_kwargs, expected):
+    airfoil = naca_airfoil_generator(**generator_kwargs)
+    max_camber, max_camber_location, max_thickness = expected
+    assert np.isclose(airfoil.max_camber, max_camber, rtol=0.01)
+    assert np.isclose(airfoil.max_thickness, max_thickness, rtol=0.01)
+    assert np.isclose(airfoil.max_camber_location, max_camber_location, rtol=0.01)
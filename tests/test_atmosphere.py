@@ -13,8 +13,8 @@ sys.path.append(".")
 
 # Dependencies #
 
+import pytest
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Local imports #
 
@@ -28,28 +28,26 @@ from tests._common import check_value
 # Tests #
 #########
 
-def test_compute_density_from_altitude_linear():
-    rho = LinearAtmosphere.compute_density_from_altitude(3000)
+@pytest.mark.parametrize("model", [LinearAtmosphere, StandardAtmosphere])
+def test_compute_density_from_altitude(model):
+    rho = model.compute_density_from_altitude(3000)
     check_value(0.9093, rho)
 
-def test_compute_altitude_from_sigma_linear():
-    altitude = LinearAtmosphere.compute_altitude_from_sigma(0.7891)
-    check_value(2400, altitude)
-
-def test_compute_sigma_from_altitude_linear():
-    sigma = LinearAtmosphere.compute_sigma_from_altitude(4.2e3)
-    check_value(0.6547, sigma)
-
-def test_compute_density_from_altitude_standard():
-    rho = StandardAtmosphere.compute_density_from_altitude(3000)
-    check_value(0.9093, rho)
+@pytest.mark.parametrize("model", [LinearAtmosphere, StandardAtmosphere])
+def test_compute_density_from_altitude_array(model):
+    altitude_array = np.linspace(0, 500, 11)
+    rho_array = model.compute_density_from_altitude(altitude_array)
+    for altitude, rho in zip(altitude_array, rho_array):
+        assert np.isclose(rho, model.compute_density_from_altitude(altitude))
 
-def test_compute_altitude_from_sigma_standard():
-    altitude = StandardAtmosphere.compute_altitude_from_sigma(0.7891)
+@pytest.mark.parametrize("model", [LinearAtmosphere, StandardAtmosphere])
+def test_compute_altitude_from_sigma(model):
+    altitude = model.compute_altitude_from_sigma(0.7891)
     check_value(2400, altitude)
 
-def test_compute_sigma_from_altitude_standard():
-    sigma = StandardAtmosphere.compute_sigma_from_altitude(4.2e3)
+@pytest.mark.parametrize("model", [LinearAtmosphere, StandardAtmosphere])
+def test_compute_sigma_from_altitude(model):
+    sigma = model.compute_sigma_from_altitude(4.2e3)
     check_value(0.6547, sigma)
 
 def test_compute_temperature_from_altitude_standard():
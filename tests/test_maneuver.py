@@ -15,14 +15,15 @@ sys.path.append(".")
 
 # Dependencies #
 
+import pytest
 import numpy as np
 import matplotlib.pyplot as plt
 
 # Local imports #
 
 # Import objects to test
-from flight_mech.plane import Plane
 from flight_mech.maneuver import TakeOffManeuver, LandingManeuver
+from flight_mech.plane import Plane
 
 # Import test tools
 from tests._common import output_folder
@@ -32,8 +33,8 @@ from tests._common import output_folder
 # Tests #
 #########
 
-def test_take_off():
-    plane = Plane("su_27")
+def test_take_off(su27):
+    plane = su27
 
     # Adjust coefficient for take off configuration
     plane.C_D_0 = 0.023
@@ -70,8 +71,105 @@ def test_take_off():
     assert np.isclose(
         take_off_maneuver.ground_distance_list[-1], 700, rtol=0.1)
 
-def test_landing():
-    plane = Plane("su_27")
+    # Check that the variables not computed during the take off are not exposed
+    with pytest.raises(AttributeError):
+        take_off_maneuver.braking_energy_list
+
+def test_take_off_adaptive_time_step(su27):
+    plane = su27
+    plane.C_D_0 = 0.023
+    plane.C_L_alpha = 3.718
+    plane.alpha_0 = -0.21 / plane.C_L_alpha
+    plane.k = 0.11732
+
+    # Compute the evolution with a fixed and an adaptive time step
+    evolutions = []
+    for adaptive_time_step in (False, True):
+        take_off_maneuver = TakeOffManeuver(
+            plane_model=plane,
+            rotation_speed=3 * np.pi / 180,
+            rotation_sequence_trigger_speed=55.83
+        )
+        take_off_maneuver.dt = 0.01
+        take_off_maneuver.nb_max_iterations = 4000
+        take_off_maneuver.adaptive_time_step = adaptive_time_step
+        take_off_maneuver.compute_evolution()
+        evolutions.append(take_off_maneuver)
+
+    assert evolutions[1].nb_steps < evolutions[0].nb_steps / 2
+    assert np.isclose(evolutions[1].rotation_start_time,
+                      evolutions[0].rotation_start_time, rtol=0.01)
+    assert np.isclose(evolutions[1].flight_start_time,
+                      evolutions[0].flight_start_time, rtol=0.01)
+    assert np.isclose(evolutions[1].ground_distance_list[-1],
+                      evolutions[0].ground_distance_list[-1], rtol=0.02)
+
+def test_take_off_sweep(su27):
+    plane = su27
+    plane.C_D_0 = 0.023
+    plane.C_L_alpha = 3.718
+    plane.alpha_0 = -0.21 / plane.C_L_alpha
+    plane.k = 0.11732
+    plane.m_payload = 400 + 95 * 2 + 70  # kg
+    plane.update_P(force=True)
+
+    take_off_maneuver = TakeOffManeuver(
+        plane_model=plane,
+        rotation_speed=3 * np.pi / 180,
+        rotation_sequence_trigger_speed=55.83
+    )
+    take_off_maneuver.dt = 0.05
+    take_off_maneuver.nb_max_iterations = 1000
+
+    # Compute the take off for several friction coefficients
+    results = take_off_maneuver.sweep(
+        ground_friction_coefficient=np.array([0.03, 0.05, 0.08]))
+    assert results["altitude"].shape == (3, 1000)
+
+    # Check that the first run is identical to a single take off
+    take_off_maneuver.compute_evolution()
+    nb_steps = take_off_maneuver.nb_steps
+    assert results["nb_steps"][0] == nb_steps
+    assert results["flight_start_time"][0] == take_off_maneuver.flight_start_time
+    assert np.array_equal(
+        results["ground_distance"][0, :nb_steps], take_off_maneuver.ground_distance_list)
+
+    # Check that the rotation is delayed by the friction
+    assert np.all(np.diff(results["rotation_start_time"]) > 0)
+
+def test_take_off_dtype(su27):
+    plane = su27
+    plane.C_D_0 = 0.023
+    plane.C_L_alpha = 3.718
+    plane.alpha_0 = -0.21 / plane.C_L_alpha
+    plane.k = 0.11732
+    plane.update_P(force=True)
+
+    # Compute the evolution in single and double precision
+    evolutions = []
+    for dtype in (np.float32, np.float64):
+        take_off_maneuver = TakeOffManeuver(
+            plane_model=plane,
+            rotation_speed=3 * np.pi / 180,
+            rotation_sequence_trigger_speed=55.83,
+            dtype=dtype
+        )
+        take_off_maneuver.dt = 0.05
+        take_off_maneuver.compute_evolution()
+        assert take_off_maneuver.altitude_list.dtype == dtype
+        evolutions.append(take_off_maneuver)
+
+    assert evolutions[0].nb_steps == evolutions[1].nb_steps
+    assert np.allclose(evolutions[0].ground_distance_list,
+                       evolutions[1].ground_distance_list, rtol=1e-5)
+
+    # Check that the phases start times are reported in double precision whatever the dtype
+    for time_name in ("rotation_start_time", "flight_start_time"):
+        assert type(getattr(evolutions[0], time_name)) is float
+        assert getattr(evolutions[0], time_name) == getattr(evolutions[1], time_name)
+
+def test_landing(su27):
+    plane = su27
 
     # Adjust coefficient for take off configuration
     plane.C_D_0 = 0.0394
@@ -108,3 +206,93 @@ def test_landing():
     assert np.isclose(landing_maneuver.time_list[-1], 12.9, rtol=0.1)
     assert np.isclose(
         landing_maneuver.ground_distance_list[-1], 434, rtol=0.1)
+
+    # Check that the variables not computed during the landing are not exposed
+    for variable in ("altitude", "pitch", "rho"):
+        with pytest.raises(AttributeError):
+            getattr(landing_maneuver, f"{variable}_list")
+
+def test_landing_compiled_kernel(su27):
+    pytest.importorskip("flight_mech._landing_kernel")
+    plane = su27
+    plane.m_fuel = plane.m_fuel * 0.1
+    plane.update_P(force=True)
+
+    # Compute the evolution with and without the compiled kernel
+    evolutions = []
+    for use_compiled_kernel in (True, False):
+        landing_maneuver = LandingManeuver(
+            plane_model=plane,
+            rotation_speed=4 * np.pi / 180,
+            initial_velocity=62.34,
+            parachute_drag_coefficient=0.6,
+            parachute_reference_surface=15
+        )
+        landing_maneuver.use_compiled_kernel = use_compiled_kernel
+        landing_maneuver.compute_evolution()
+        evolutions.append(landing_maneuver)
+
+    assert evolutions[0].phase_list == evolutions[1].phase_list
+    assert evolutions[0].braking_start_time == evolutions[1].braking_start_time
+    for variable in ("velocity", "ground_distance", "braking_energy"):
+        assert np.allclose(getattr(evolutions[0], f"{variable}_list"),
+                           getattr(evolutions[1], f"{variable}_list"))
+
+@pytest.mark.parametrize("initial_velocity", [20, 100])
+def test_landing_low_friction(su27, initial_velocity):
+    plane = su27
+    plane.m_fuel = plane.m_fuel * 0.1
+    plane.update_P(force=True)
+
+    # Check that a landing without brakes is computed until the plane stops, with both implementations
+    for use_compiled_kernel in (True, False):
+        landing_maneuver = LandingManeuver(
+            plane_model=plane,
+            rotation_speed=4 * np.pi / 180,
+            initial_velocity=initial_velocity,
+            braking_friction_coefficient=0
+        )
+        landing_maneuver.use_compiled_kernel = use_compiled_kernel
+        landing_maneuver.compute_evolution()
+
+        assert landing_maneuver.phase_list[-1] == "stopped"
+        assert landing_maneuver.velocity_list[-1] == 0
+        assert landing_maneuver.stop_time is not None
+
+def test_landing_custom_aerodynamic_model(su27):
+    # Define a plane with a lift coefficient the compiled kernel does not know
+    class ReducedLiftPlane(Plane):
+        def C_L(self, alpha: float) -> float:
+            return 0.5 * super().C_L(alpha)
+
+    plane = su27
+    plane.__class__ = ReducedLiftPlane
+
+    # Check that the custom model is used whether the compiled kernel is enabled or not
+    evolutions = []
+    for use_compiled_kernel in (True, False):
+        landing_maneuver = LandingManeuver(
+            plane_model=plane,
+            rotation_speed=4 * np.pi / 180,
+            initial_velocity=62.34,
+            parachute_drag_coefficient=0.6,
+            parachute_reference_surface=15
+        )
+        landing_maneuver.use_compiled_kernel = use_compiled_kernel
+        assert not landing_maneuver._can_use_compiled_kernel()
+        landing_maneuver.compute_evolution()
+        evolutions.append(landing_maneuver)
+
+    assert np.array_equal(evolutions[0].lift_coefficient_list, evolutions[1].lift_coefficient_list)
+    assert np.isclose(evolutions[0].lift_coefficient_list[1],
+                      0.5 * Plane.C_L(plane, evolutions[0].incidence_list[1]))
+
+    # Check that an override of the drag coefficient on the instance is also detected
+    plane.__class__ = Plane
+    plane.C_D = lambda alpha=None, C_L=None: 2 * Plane.C_D(plane, alpha, C_L)
+    landing_maneuver = LandingManeuver(
+        plane_model=plane,
+        rotation_speed=4 * np.pi / 180,
+        initial_velocity=62.34
+    )
+    assert not landing_maneuver._can_use_compiled_kernel()
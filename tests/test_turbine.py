@@ -14,13 +14,14 @@ sys.path.append(".")
 
 # Dependencies #
 
+import pytest
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Local imports #
 
 # Import objects to test
-from flight_mech.turbine import TurbojetSingleBody, VARIABLE_TO_CODE
+from flight_mech.turbine import TurbojetSingleBody, VARIABLE_TO_CODE, air
+from flight_mech.fuel import FuelModel, FuelTable
 
 # Import test tools
 from tests._common import check_value, output_folder
@@ -35,16 +36,50 @@ def test_compute_thrust():
     turbojet.A4_star = 5e-2
     assert np.isclose(turbojet.thrust, 46117.878152741425, rtol=0.001)
 
+def test_stations_cache_invalidation():
+    turbojet = TurbojetSingleBody()
+    turbojet.A4_star = 5e-2
+    initial_thrust = turbojet.thrust
+
+    # Check that the stations are recomputed when a parameter changes
+    turbojet.A4_star = 1e-1
+    assert np.isclose(turbojet.thrust, 2 * initial_thrust, rtol=1e-9)
+    turbojet.altitude = 5000
+    assert turbojet.thrust < 2 * initial_thrust
+
+    # Check that the stations are recomputed when the fuel is edited in place
+    turbojet.fuel = FuelModel(
+        density=FuelTable.KEROSENE.density, lower_heating_value=FuelTable.KEROSENE.lower_heating_value)
+    initial_Wf = turbojet.Wf
+    turbojet.fuel.lower_heating_value /= 2
+    assert np.isclose(turbojet.Wf, 2 * initial_Wf, rtol=1e-9)
+
+def test_stations_gamma_change():
+    turbojet = TurbojetSingleBody()
+    turbojet.M0 = 0.8
+    initial_gamma = air.gamma
+    try:
+        # Check that the inlet stations follow a change of gamma
+        air.gamma = 1.3
+        compression_factor = 1 + (air.gamma - 1) / 2 * turbojet.M0 ** 2
+        assert np.isclose(turbojet.T0, turbojet.ambient_temperature * compression_factor, rtol=1e-12)
+        assert np.isclose(turbojet.P0, turbojet.ambient_pressure *
+                          compression_factor ** (air.gamma / (air.gamma - 1)), rtol=1e-12)
+    finally:
+        air.gamma = initial_gamma
+
 def test_tune_A4_star_for_desired_thrust():
     turbojet = TurbojetSingleBody()
     turbojet.tune_A4_star_for_desired_thrust(7500)
     assert np.isclose(turbojet.A4_star, 0.008131337010233023, rtol=0.001)
 
-def test_plot_graph():
+@pytest.mark.parametrize("variable", [
+    variable if variable == "pressure" else pytest.param(variable, marks=pytest.mark.slow)
+    for variable in VARIABLE_TO_CODE])
+def test_plot_graph(variable):
     turbojet = TurbojetSingleBody()
-    for variable in VARIABLE_TO_CODE:
-        turbojet.plot_graph(variable, hold_plot=True, clear_before_plot=True, save_path=os.path.join(
-            output_folder, f"{variable}_graph.png"))
+    turbojet.plot_graph(variable, hold_plot=True, clear_before_plot=True, save_path=os.path.join(
+        output_folder, f"{variable}_graph.png"))
 
 def test_get_design_variable():
     turbojet = TurbojetSingleBody()
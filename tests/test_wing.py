@@ -9,19 +9,22 @@ Test file for the wing module.
 # Python imports #
 
 import os
+import math
+import itertools
 import sys
 sys.path.append(".")
 
 # Dependencies #
 
+import pytest
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 
 # Local imports #
 
 # Import objects to test
-from flight_mech.wing import Wing, compute_chord_min_and_max_for_trapezoidal_wing
+from flight_mech.wing import Wing, compute_chord_min_and_max_for_trapezoidal_wing, \
+    _build_fourrier_matrix, FOURRIER_KERNEL_MIN_POINTS
 from flight_mech.atmosphere import StandardAtmosphere
 from flight_mech.airfoil import Airfoil
 
@@ -29,45 +32,128 @@ from flight_mech.airfoil import Airfoil
 from tests._common import check_value, output_folder
 
 
+#############
+# Constants #
+#############
+
+# Air properties used for the drag computations
+sea_level_rho = StandardAtmosphere.compute_density_from_altitude(0)
+sea_level_nu = StandardAtmosphere.compute_kinematic_viscosity_from_altitude(0)
+
+# Geometry shared by several tests, read-only to catch any in-place modification by the wing
+y_array_100 = np.linspace(0, 10, 100)
+chord_length_array_100 = np.linspace(3, 1, 100)
+negative_twisting_angle_array_100 = np.linspace(0, -0.05, 100)
+for shared_array in (y_array_100, chord_length_array_100, negative_twisting_angle_array_100):
+    shared_array.setflags(write=False)
+
 #########
 # Tests #
 #########
 
-def test_create_3D_animation():
+@pytest.mark.slow
+@pytest.mark.parametrize("nb_points_on_wing", [32, 100])
+def test_create_3D_animation(nb_points_on_wing, naca4412_airfoil_copy):
     wing = Wing()
-    wing.y_array = np.linspace(0, 10, 100)
-    wing.chord_length_array = np.linspace(3, 1, 100)
-    wing.twisting_angle_array = np.linspace(0, 0.1, 100)
-    wing.x_center_offset_array = np.zeros(100)
-    airfoil = Airfoil("naca4412")
-    wing.base_airfoil = airfoil
+    wing.mesh_dtype = np.float32
+    wing.y_array = np.linspace(0, 10, nb_points_on_wing)
+    wing.chord_length_array = np.linspace(3, 1, nb_points_on_wing)
+    wing.twisting_angle_array = np.linspace(0, 0.1, nb_points_on_wing)
+    wing.x_center_offset_array = np.zeros(nb_points_on_wing)
+    wing.base_airfoil = naca4412_airfoil_copy
 
     # TEMP
     # wing.plot_3D()
 
     # Create animation
-    wing.create_3D_animation(os.path.join(output_folder, "wing.gif"))
+    wing.create_3D_animation(os.path.join(
+        output_folder, f"wing_{nb_points_on_wing}.gif"))
+
+def test_iter_3D_frames(base_wing):
+    frames = list(itertools.islice(base_wing.iter_3D_frames(nb_frames=4), 2))
+    assert len(frames) == 2
+    assert frames[0].ndim == 3
+    assert frames[0].shape[2] in (3, 4)
+    assert frames[0].dtype == np.uint8
+    assert not np.array_equal(frames[0], frames[1])
+
+def test_save_3D_shape(naca4412_airfoil_copy):
+    wing = Wing()
+    wing.y_array = np.linspace(0, 10, 20)
+    wing.chord_length_array = np.linspace(3, 1, 20)
+    wing.twisting_angle_array = np.linspace(0, 0.1, 20)
+    wing.x_center_offset_array = np.zeros(20)
+    wing.base_airfoil = naca4412_airfoil_copy
     wing.save_3D_shape(os.path.join(output_folder, "wing.stl"))
 
+    # Check that the file is a binary stl, with a 80 bytes header, the number of triangles and 50 bytes per triangle
+    with open(os.path.join(output_folder, "wing.stl"), "rb") as file:
+        content = file.read()
+    nb_triangles = int.from_bytes(content[80:84], "little")
+    assert nb_triangles > 0
+    assert len(content) == 84 + 50 * nb_triangles
+
+
+def test_create_wing_3D_surface_cache():
+    wing = Wing()
+    wing.y_array = np.linspace(0, 10, 20)
+    wing.chord_length_array = np.linspace(3, 1, 20)
+    wing.initialize()
+
+    # Check that the cached surface is a copy
+    surface_1 = wing.create_wing_3D_surface(20)
+    surface_2 = wing.create_wing_3D_surface(20)
+    assert surface_1 is not surface_2
+    assert np.array_equal(surface_1.points, surface_2.points)
+
+    # Check that the dtype of the mesh can be lowered for visualization
+    wing.mesh_dtype = np.float32
+    surface_float32 = wing.create_wing_3D_surface(20)
+    assert surface_float32.points.dtype == np.float32
+    assert np.allclose(surface_float32.points, surface_1.points, atol=1e-5)
+    wing.mesh_dtype = np.float64
+
+    # Check that a change of geometry creates a new surface
+    wing.chord_length_array = np.linspace(3, 2, 20)
+    surface_3 = wing.create_wing_3D_surface(20)
+    assert not np.array_equal(surface_1.points, surface_3.points)
 
-def test_plot_2D():
+    # Check that each geometry is stored under its own key
+    assert len(wing._surface_cache) == 3
+
+@pytest.mark.parametrize("nb_points_on_wing", [32, pytest.param(100, marks=pytest.mark.slow)])
+def test_plot_2D(nb_points_on_wing):
     wing = Wing()
-    wing.y_array = np.linspace(0, 10, 100)
-    wing.chord_length_array = np.linspace(3, 1, 100)
+    wing.y_array = np.linspace(0, 10, nb_points_on_wing)
+    wing.chord_length_array = np.linspace(3, 1, nb_points_on_wing)
     wing.initialize()
     wing.plot_2D(hold_plot=True, save_path=os.path.join(
-        output_folder, "wing.png"), clear_before_plot=True)
+        output_folder, f"wing_{nb_points_on_wing}.png"), clear_before_plot=True)
 
 def test_surface():
     wing = Wing()
-    wing.y_array = np.linspace(0, 10, 100)
-    wing.chord_length_array = np.linspace(3, 1, 100)
+    wing.y_array = y_array_100
+    wing.chord_length_array = chord_length_array_100
     true_surface = 10 * (3 + 1) / 2
     assert wing.single_side_surface == true_surface
 
-def test_compute_lift_and_induced_drag_coefficients_1():
+    # Check that the cached surface is updated with the chord
+    wing.chord_length_array = np.linspace(2, 1, 100)
+    assert np.isclose(wing.single_side_surface, 10 * (2 + 1) / 2)
+    assert np.isclose(wing.aspect_ratio, 20 ** 2 / 30)
+
+    # Check that the cached geometry is updated with in-place edits of the arrays
+    wing.y_array = y_array_100.copy()
+    wing.y_array[:] *= 2
+    assert wing.wing_span == 40
+    assert np.isclose(wing.single_side_surface, 20 * (2 + 1) / 2)
+    wing.chord_length_array[:] = 2
+    assert np.isclose(wing.single_side_surface, 20 * 2)
+    assert wing.taper_ratio == 1
+
+@pytest.mark.parametrize("nb_points_on_wing", [40, pytest.param(100, marks=pytest.mark.slow)])
+def test_compute_lift_and_induced_drag_coefficients_1(nb_points_on_wing):
     wing = Wing()
-    nb_points_on_wing = 100
     airfoil = Airfoil("naca65210")
     true_aspect_ratio = 9
     chord_max = 72.6e-2  # m
@@ -79,7 +165,7 @@ def test_compute_lift_and_induced_drag_coefficients_1():
     wing.base_airfoil = airfoil
     wing.initialize()
 
-    assert wing.aspect_ratio == true_aspect_ratio
+    assert np.isclose(wing.aspect_ratio, true_aspect_ratio)
     check_value(0.4, wing.taper_ratio)
     check_value(-1.2 * np.pi / 180, airfoil.compute_alpha_zero_lift())
 
@@ -87,9 +173,9 @@ def test_compute_lift_and_induced_drag_coefficients_1():
         4 * np.pi / 180, 4)
     check_value(0.465, CL)
 
-def test_compute_lift_and_induced_drag_coefficients_2():
+@pytest.mark.parametrize("nb_points_on_wing", [40, pytest.param(100, marks=pytest.mark.slow)])
+def test_compute_lift_and_induced_drag_coefficients_2(nb_points_on_wing):
     wing = Wing()
-    nb_points_on_wing = 100
     airfoil = Airfoil("naca2412")
     true_aspect_ratio = 7.52
     true_surface = 16.3  # m2
@@ -97,7 +183,7 @@ def test_compute_lift_and_induced_drag_coefficients_2():
 
     chord_min, chord_max = compute_chord_min_and_max_for_trapezoidal_wing(
         true_surface, true_aspect_ratio, true_taper_ratio)
-    wing_span = np.sqrt(true_aspect_ratio * true_surface)
+    wing_span = math.sqrt(true_aspect_ratio * true_surface)
     wing.y_array = np.linspace(0, wing_span / 2, nb_points_on_wing)
     wing.chord_length_array = np.linspace(
         chord_max, chord_min, nb_points_on_wing)
@@ -116,42 +202,111 @@ def test_compute_lift_and_induced_drag_coefficients_2():
     check_value(0.1593, CL)
     check_value(0.00166, CD)
 
-def test_compute_zero_lift_drag():
-    # TODO : change wing geometry to avoid transition
+def test_compute_lift_and_induced_drag_coefficients_batch(naca4412_airfoil_copy):
     wing = Wing()
-    wing.y_array = np.linspace(0, 10, 100)
-    wing.chord_length_array = np.linspace(3, 1, 100)
-    wing.twisting_angle_array = np.linspace(0, 0.1, 100)
-    wing.x_center_offset_array = np.zeros(100)
-    airfoil = Airfoil("naca4412")
-    wing.base_airfoil = airfoil
+    wing.y_array = y_array_100
+    wing.chord_length_array = chord_length_array_100
+    wing.twisting_angle_array = negative_twisting_angle_array_100
+    wing.base_airfoil = naca4412_airfoil_copy
+    wing.initialize()
+
+    # Compare the batch computation to the single ones
+    alpha_array = np.linspace(-0.1, 0.2, 7)
+    CL_array, CD_array = wing.compute_lift_and_induced_drag_coefficients_batch(
+        alpha_array)
+    for i, alpha in enumerate(alpha_array):
+        CL, CD = wing.compute_lift_and_induced_drag_coefficients(alpha)
+        assert np.isclose(CL_array[i], CL, rtol=1e-12)
+        assert np.isclose(CD_array[i], CD, rtol=1e-12)
+
+    # Check that the returned ids are a float copy of the shared table
+    _, n_vec_odd = wing.compute_fourrier_coefficients(0.05)
+    assert n_vec_odd.dtype == np.float64
+    n_vec_odd[:] = 0
+    _, n_vec_odd = wing.compute_fourrier_coefficients(0.05)
+    assert np.array_equal(n_vec_odd, 2 * np.arange(10) + 1)
+
+def test_fourrier_cache_invalidation(naca4412_airfoil_copy):
+    wing = Wing()
+    wing.y_array = y_array_100
+    wing.chord_length_array = chord_length_array_100
+    wing.base_airfoil = naca4412_airfoil_copy
+    wing.initialize()
+    CL_1, _ = wing.compute_lift_and_induced_drag_coefficients(0.05)
+
+    # Change the geometry and compare to a new wing
+    wing.twisting_angle_array = negative_twisting_angle_array_100
+    CL_2, _ = wing.compute_lift_and_induced_drag_coefficients(0.05)
+    new_wing = Wing()
+    new_wing.y_array = wing.y_array
+    new_wing.chord_length_array = wing.chord_length_array
+    new_wing.twisting_angle_array = wing.twisting_angle_array
+    new_wing.base_airfoil = wing.base_airfoil
+    new_wing.initialize()
+    CL_3, _ = new_wing.compute_lift_and_induced_drag_coefficients(0.05)
+
+    assert not np.isclose(CL_2, CL_1)
+    assert CL_2 == CL_3
+
+    # Edit the chord length in place and compare to a new wing
+    wing.chord_length_array = wing.chord_length_array.copy()
+    wing.chord_length_array[:] = 2
+    CL_4, _ = wing.compute_lift_and_induced_drag_coefficients(0.05)
+    new_wing.chord_length_array = np.full(wing.y_array.shape, 2.)
+    CL_5, _ = new_wing.compute_lift_and_induced_drag_coefficients(0.05)
+
+    assert not np.isclose(CL_4, CL_2)
+    assert CL_4 == CL_5
 
-    rho = StandardAtmosphere.compute_density_from_altitude(0)
-    nu = StandardAtmosphere.compute_kinematic_viscosity_from_altitude(0)
+def test_fourrier_matrix_kernel(naca4412_airfoil_copy):
+    wing = Wing()
+    wing.y_array = y_array_100
+    wing.chord_length_array = chord_length_array_100
+    wing.base_airfoil = naca4412_airfoil_copy
+    wing.initialize()
+
+    # Compare the compiled and numpy versions of the fourrier matrix
+    nb_points_fourrier = FOURRIER_KERNEL_MIN_POINTS
+    theta_array = np.linspace(
+        np.pi / 2 / nb_points_fourrier, np.pi / 2, nb_points_fourrier)
+    n_vec_odd = 2 * np.arange(nb_points_fourrier) + 1
+    mu_array = np.linspace(0.1, 0.2, nb_points_fourrier)
+    sin_table = np.sin(n_vec_odd[None, :] * theta_array[:, None])
+    mat_A = (np.sin(theta_array)[:, None] +
+             n_vec_odd[None, :] * mu_array[:, None]) * sin_table
+    assert np.allclose(_build_fourrier_matrix(
+        np.sin(theta_array), n_vec_odd, mu_array, sin_table), mat_A, rtol=1e-12, atol=1e-12)
+
+    # Check that the lift converges with the number of points
+    CL_1, _ = wing.compute_lift_and_induced_drag_coefficients(0.05, 20)
+    CL_2, _ = wing.compute_lift_and_induced_drag_coefficients(
+        0.05, nb_points_fourrier)
+    assert np.isclose(CL_1, CL_2, rtol=1e-2)
+
+def test_compute_zero_lift_drag(base_wing):
+    # TODO : change wing geometry to avoid transition
+    wing = base_wing
     drag = wing.compute_zero_lift_drag(
-        velocity=1, rho=rho, nu=nu, drag_method="blasius", velocity_method="constant")
+        velocity=1, rho=sea_level_rho, nu=sea_level_nu, drag_method="blasius", velocity_method="constant")
 
     # TODO : add drag value check
     print(drag)
 
+    # Compare the drag of all slices at once to the drag of each slice
+    linear_drag_array = wing.compute_zero_lift_drag_on_wing_slice(
+        slice(None), 1, sea_level_rho, sea_level_nu, "blasius")
+    for i in (0, 50, 99):
+        assert np.isclose(linear_drag_array[i], wing.compute_zero_lift_drag_on_wing_slice(
+            i, 1, sea_level_rho, sea_level_nu, "blasius"), rtol=1e-12)
 
-def test_create_3D_animation_with_drag():
-    # Create wing
-    wing = Wing()
-    wing.y_array = np.linspace(0, 10, 100)
-    wing.chord_length_array = np.linspace(3, 1, 100)
-    wing.twisting_angle_array = np.linspace(0, 0.1, 100)
-    wing.x_center_offset_array = np.zeros(100)
-    airfoil = Airfoil("naca4412")
-    wing.base_airfoil = airfoil
 
-    # Define drag parameters
-    rho = StandardAtmosphere.compute_density_from_altitude(0)
-    nu = StandardAtmosphere.compute_kinematic_viscosity_from_altitude(0)
+@pytest.mark.slow
+def test_create_3D_animation_with_drag(base_wing):
+    wing = base_wing
+    wing.mesh_dtype = np.float32
 
     # TEMP
-    # wing.plot_3D(velocity=1, rho=rho, nu=nu, show_drag="blasius")
+    # wing.plot_3D(velocity=1, rho=sea_level_rho, nu=sea_level_nu, show_drag="blasius")
 
     wing.create_3D_animation(os.path.join(
-        output_folder, "wing_with_drag.gif"), nb_frames=120, time_step=1 / 60, velocity=1, rho=rho, nu=nu, show_drag="blasius")
-    wing.save_3D_shape(os.path.join(output_folder, "wing.stl"))
+        output_folder, "wing_with_drag.gif"), nb_frames=120, time_step=1 / 60, velocity=1, rho=sea_level_rho, nu=sea_level_nu, show_drag="blasius")